@@ -0,0 +1,58 @@
+from typing import Dict, List, Tuple
+
+import pytest
+from rdflib import RDF, XSD, BNode, Dataset, Literal, Namespace, URIRef
+from rdflib.graph import DATASET_DEFAULT_GRAPH_ID
+from rdflib.term import Node
+
+EX = Namespace("http://example.com/")
+DEFAULT_DATASET_SIZES = "1000,10000"
+STORES = ("Oxigraph", "Memory")
+
+Quad = Tuple[Node, Node, Node, URIRef]
+_datasets: Dict[int, List[Quad]] = {}
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--dataset-sizes",
+        default=DEFAULT_DATASET_SIZES,
+        help=f"comma separated numbers of quads of the generated datasets (default: {DEFAULT_DATASET_SIZES})",
+    )
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    if "size" in metafunc.fixturenames:
+        sizes = [int(size) for size in metafunc.config.getoption("dataset_sizes").split(",")]
+        metafunc.parametrize("size", sizes)
+
+
+def generate_quads(size: int) -> List[Quad]:
+    """Deterministic dataset mixing IRIs, blank nodes, typed and language-tagged literals in a few graphs."""
+    if size not in _datasets:
+        quads: List[Quad] = []
+        for i in range(size):
+            subject = BNode(f"b{i // 10}") if i % 7 == 0 else EX[f"entity/{i // 10}"]
+            graph = DATASET_DEFAULT_GRAPH_ID if i % 3 == 0 else EX[f"graph/{i % 5}"]
+            kind = i % 4
+            if kind == 0:
+                quads.append((subject, RDF.type, EX[f"Class{i % 20}"], graph))
+            elif kind == 1:
+                quads.append((subject, EX[f"p{i % 50}"], Literal(i, datatype=XSD.integer), graph))
+            elif kind == 2:
+                quads.append((subject, EX.label, Literal(f"label {i}", lang="en"), graph))
+            else:
+                quads.append((subject, EX[f"link{i % 10}"], EX[f"entity/{(i * 7) % size // 10}"], graph))
+        _datasets[size] = quads
+    return _datasets[size]
+
+
+def fill_dataset(store: str, size: int) -> Dataset:
+    dataset = Dataset(store=store)
+    dataset.addN((s, p, o, dataset.get_context(g)) for s, p, o, g in generate_quads(size))
+    return dataset
+
+
+@pytest.fixture
+def quads(size: int) -> List[Quad]:
+    return generate_quads(size)
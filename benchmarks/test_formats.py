@@ -0,0 +1,80 @@
+from typing import Dict, Tuple, Union
+
+import pytest
+from conftest import STORES, fill_dataset, generate_quads
+from pytest_benchmark.fixture import BenchmarkFixture
+from rdflib import Dataset, Graph
+
+# Oxigraph format name, equivalent rdflib format name and if the format supports named graphs
+FORMATS = (
+    ("ox-nt", "nt", False),
+    ("ox-nquads", "nquads", True),
+    ("ox-turtle", "turtle", False),
+    ("ox-trig", "trig", True),
+    ("ox-n3", "n3", False),
+    ("ox-xml", "xml", False),
+    ("ox-json-ld", "json-ld", True),
+    ("ox-streaming-json-ld", "json-ld", True),
+)
+IMPLEMENTATIONS = ("ox", "rdflib")
+
+_serializations: Dict[Tuple[str, int], bytes] = {}
+
+
+def _fill(store: str, size: int, with_graphs: bool) -> Union[Graph, Dataset]:
+    if with_graphs:
+        return fill_dataset(store, size)
+    graph = Graph(store=store)
+    graph.addN((s, p, o, graph) for s, p, o, _ in generate_quads(size))
+    return graph
+
+
+def _serialization(serializer: str, size: int, with_graphs: bool) -> bytes:
+    if (serializer, size) not in _serializations:
+        data = _fill("Memory", size, with_graphs).serialize(format=serializer, encoding="utf-8")
+        _serializations[(serializer, size)] = data
+    return _serializations[(serializer, size)]
+
+
+@pytest.mark.parametrize("store", STORES)
+@pytest.mark.parametrize("implementation", IMPLEMENTATIONS)
+@pytest.mark.parametrize(("ox_format", "rdflib_format", "with_graphs"), FORMATS)
+def test_parse(
+    benchmark: BenchmarkFixture,
+    ox_format: str,
+    rdflib_format: str,
+    with_graphs: bool,
+    implementation: str,
+    store: str,
+    size: int,
+) -> None:
+    benchmark.group = f"parse-{ox_format}-{size}"
+    if implementation == "rdflib" and rdflib_format == "n3" and store == "Oxigraph":
+        pytest.skip("The rdflib N3 parser requires a formula-aware store")
+    # The streaming JSON-LD parser requires the keys to be in the order of the streaming serializer
+    data = _serialization(ox_format if ox_format == "ox-streaming-json-ld" else rdflib_format, size, with_graphs)
+    parse_format = ox_format if implementation == "ox" else rdflib_format
+
+    def parse() -> None:
+        target = Dataset(store=store) if with_graphs else Graph(store=store)
+        target.parse(data=data, format=parse_format)
+
+    benchmark(parse)
+
+
+@pytest.mark.parametrize("store", STORES)
+@pytest.mark.parametrize("implementation", IMPLEMENTATIONS)
+@pytest.mark.parametrize(("ox_format", "rdflib_format", "with_graphs"), FORMATS)
+def test_serialize(
+    benchmark: BenchmarkFixture,
+    ox_format: str,
+    rdflib_format: str,
+    with_graphs: bool,
+    implementation: str,
+    store: str,
+    size: int,
+) -> None:
+    benchmark.group = f"serialize-{ox_format}-{size}"
+    source = _fill(store, size, with_graphs)
+    serialize_format = ox_format if implementation == "ox" else rdflib_format
+    benchmark(lambda: source.serialize(format=serialize_format, encoding="utf-8"))
@@ -0,0 +1,52 @@
+from typing import Any, Dict, Tuple
+
+import pytest
+from conftest import STORES, fill_dataset
+from pytest_benchmark.fixture import BenchmarkFixture
+
+SELECT_QUERY = """
+PREFIX ex: <http://example.com/>
+SELECT ?s ?label WHERE { ?s a ex:Class4 ; ex:label ?label . FILTER(LANG(?label) = "en") }
+"""
+AGGREGATE_QUERY = """
+SELECT ?p (COUNT(*) AS ?count) WHERE { GRAPH ?g { ?s ?p ?o } } GROUP BY ?p ORDER BY DESC(?count)
+"""
+CONSTRUCT_QUERY = """
+PREFIX ex: <http://example.com/>
+CONSTRUCT { ?o ex:linkedFrom ?s } WHERE { GRAPH ?g { ?s ex:link1 ?o } }
+"""
+UPDATE = """
+PREFIX ex: <http://example.com/>
+DELETE { ?s ex:label ?label } INSERT { ?s ex:name ?label } WHERE { ?s ex:label ?label }
+"""
+
+
+@pytest.mark.parametrize("store", STORES)
+def test_select(benchmark: BenchmarkFixture, store: str, size: int) -> None:
+    benchmark.group = f"select-{size}"
+    dataset = fill_dataset(store, size)
+    benchmark(lambda: list(dataset.query(SELECT_QUERY)))
+
+
+@pytest.mark.parametrize("store", STORES)
+def test_select_aggregate(benchmark: BenchmarkFixture, store: str, size: int) -> None:
+    benchmark.group = f"select-aggregate-{size}"
+    dataset = fill_dataset(store, size)
+    benchmark(lambda: list(dataset.query(AGGREGATE_QUERY)))
+
+
+@pytest.mark.parametrize("store", STORES)
+def test_construct(benchmark: BenchmarkFixture, store: str, size: int) -> None:
+    benchmark.group = f"construct-{size}"
+    dataset = fill_dataset(store, size)
+    benchmark(lambda: len(dataset.query(CONSTRUCT_QUERY).graph))
+
+
+@pytest.mark.parametrize("store", STORES)
+def test_update(benchmark: BenchmarkFixture, store: str, size: int) -> None:
+    benchmark.group = f"update-{size}"
+
+    def setup() -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+        return (fill_dataset(store, size),), {}
+
+    benchmark.pedantic(lambda dataset: dataset.update(UPDATE), setup=setup, rounds=5)
@@ -0,0 +1,69 @@
+from typing import Any, Dict, List, Tuple
+
+import pytest
+from conftest import EX, STORES, Quad, fill_dataset
+from pytest_benchmark.fixture import BenchmarkFixture
+from rdflib import RDF, Dataset
+
+
+def _empty_dataset(store: str, quads: List[Quad]) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+    dataset = Dataset(store=store)
+    return (dataset, [(s, p, o, dataset.get_context(g)) for s, p, o, g in quads]), {}
+
+
+@pytest.mark.parametrize("store", STORES)
+def test_add(benchmark: BenchmarkFixture, store: str, quads: List[Quad]) -> None:
+    benchmark.group = f"add-{len(quads)}"
+
+    def add(dataset: Dataset, quads: List[Tuple[Any, ...]]) -> None:
+        for s, p, o, g in quads:
+            dataset.store.add((s, p, o), g)
+
+    benchmark.pedantic(add, setup=lambda: _empty_dataset(store, quads), rounds=5)
+
+
+@pytest.mark.parametrize("store", STORES)
+def test_add_n(benchmark: BenchmarkFixture, store: str, quads: List[Quad]) -> None:
+    benchmark.group = f"addN-{len(quads)}"
+    benchmark.pedantic(lambda dataset, quads: dataset.addN(quads), setup=lambda: _empty_dataset(store, quads), rounds=5)
+
+
+@pytest.mark.parametrize("store", STORES)
+def test_remove(benchmark: BenchmarkFixture, store: str, size: int) -> None:
+    benchmark.group = f"remove-{size}"
+
+    def setup() -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+        return (fill_dataset(store, size),), {}
+
+    def remove(dataset: Dataset) -> None:
+        dataset.remove((None, RDF.type, None))
+
+    benchmark.pedantic(remove, setup=setup, rounds=5)
+
+
+@pytest.mark.parametrize("store", STORES)
+def test_triples(benchmark: BenchmarkFixture, store: str, size: int) -> None:
+    benchmark.group = f"triples-{size}"
+    dataset = fill_dataset(store, size)
+    benchmark(lambda: sum(1 for _ in dataset.store.triples((None, None, None), None)))
+
+
+@pytest.mark.parametrize("store", STORES)
+def test_triples_pattern(benchmark: BenchmarkFixture, store: str, size: int) -> None:
+    benchmark.group = f"triples-pattern-{size}"
+    dataset = fill_dataset(store, size)
+    benchmark(lambda: sum(1 for _ in dataset.store.triples((None, RDF.type, EX.Class1), None)))
+
+
+@pytest.mark.parametrize("store", STORES)
+def test_len(benchmark: BenchmarkFixture, store: str, size: int) -> None:
+    benchmark.group = f"len-{size}"
+    dataset = fill_dataset(store, size)
+    benchmark(lambda: len(dataset.get_context(EX["graph/1"])))
+
+
+@pytest.mark.parametrize("store", STORES)
+def test_contexts(benchmark: BenchmarkFixture, store: str, size: int) -> None:
+    benchmark.group = f"contexts-{size}"
+    dataset = fill_dataset(store, size)
+    benchmark(lambda: list(dataset.store.contexts()))
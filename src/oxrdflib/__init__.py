@@ -1,3 +1,20 @@
-from .store import OxigraphStore
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["OxigraphStore"]
+if TYPE_CHECKING:
+    from .async_store import AsyncOxigraphStore
+    from .store import OxigraphStore
+
+__all__ = ["AsyncOxigraphStore", "OxigraphStore"]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    # The stores are only imported when used, the parsers and serializers are loaded without them
+    if name == "OxigraphStore":
+        from .store import OxigraphStore
+
+        return OxigraphStore
+    if name == "AsyncOxigraphStore":
+        from .async_store import AsyncOxigraphStore
+
+        return AsyncOxigraphStore
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,62 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Generic, Hashable, NamedTuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a cache, in the spirit of :func:`functools.lru_cache`."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LruCache(Generic[K, V]):
+    """A thread-safe size-bounded mapping evicting the least recently used entries first."""
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize <= 0:
+            raise ValueError(f"The cache size must be positive, {maxsize} given")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[K, V] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: K, compute: Callable[[K], V]) -> V:
+        """Return the cached value for ``key``, computing and storing it with ``compute`` if missing.
+
+        ``compute`` is called without holding the lock, so it might be called concurrently for the same key.
+        """
+        data = self._data
+        with self._lock:
+            try:
+                data.move_to_end(key)
+            except KeyError:
+                self.misses += 1
+            else:
+                self.hits += 1
+                return data[key]
+        value = compute(key)
+        with self._lock:
+            data[key] = value
+            if len(data) > self.maxsize:
+                data.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def __len__(self) -> int:
+        return len(self._data)
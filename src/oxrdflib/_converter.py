@@ -1,4 +1,4 @@
-from typing import Optional, Tuple, Union
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 import pyoxigraph as ox
 from rdflib import Graph
@@ -6,18 +6,77 @@ from rdflib.graph import DATASET_DEFAULT_GRAPH_ID
 from rdflib.store import Store
 from rdflib.term import BNode, Literal, Node, URIRef
 
+from oxrdflib._cache import CacheInfo, LruCache
 from oxrdflib._type import _Quad, _Triple, _TriplePattern
 
+DEFAULT_TERM_CACHE_SIZE = 4096
+
+
+class TermCache:
+    """Bounded LRU cache of the term conversions between rdflib and Oxigraph.
+
+    The two conversion directions are cached separately and each of them keeps at most ``maxsize`` terms.
+    :meth:`cache_info` reports this per-direction ``maxsize`` and the hits, misses and size summed over both directions.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_TERM_CACHE_SIZE) -> None:
+        self._to_ox: LruCache[Node, Union[ox.NamedNode, ox.BlankNode, ox.Literal]] = LruCache(maxsize)
+        self._from_ox: LruCache[Union[ox.NamedNode, ox.BlankNode, ox.Literal], Node] = LruCache(maxsize)
+
+    def to_ox(self, term: Node) -> Union[ox.NamedNode, ox.BlankNode, ox.Literal]:
+        return self._to_ox.get(term, _to_ox_term)
+
+    def from_ox(self, term: Union[ox.NamedNode, ox.BlankNode, ox.Literal]) -> Node:
+        return self._from_ox.get(term, _from_ox_term)
+
+    def clear(self) -> None:
+        self._to_ox.clear()
+        self._from_ox.clear()
+
+    def cache_info(self) -> CacheInfo:
+        to_ox_info = self._to_ox.cache_info()
+        from_ox_info = self._from_ox.cache_info()
+        return CacheInfo(
+            to_ox_info.hits + from_ox_info.hits,
+            to_ox_info.misses + from_ox_info.misses,
+            to_ox_info.maxsize,
+            to_ox_info.currsize + from_ox_info.currsize,
+        )
+
 
 def to_ox(
     term: Optional[Union[Node, _Triple, _Quad, Graph]],
     context: Optional[Graph] = None,
+    cache: Optional[TermCache] = None,
 ) -> Optional[Union[ox.NamedNode, ox.BlankNode, ox.Literal, ox.DefaultGraph, ox.Quad]]:
     """Convert an rdflib term to an Oxigraph term."""
     if term is None:
         return None
     if term == DATASET_DEFAULT_GRAPH_ID:
         return ox.DefaultGraph()
+    if isinstance(term, (URIRef, BNode, Literal)):
+        return _to_ox_term(term) if cache is None else cache.to_ox(term)
+    if isinstance(term, Graph):
+        return to_ox(term.identifier, cache=cache)
+    if isinstance(term, tuple):
+        if len(term) == 3:
+            return ox.Quad(
+                to_ox(term[0], cache=cache),
+                to_ox(term[1], cache=cache),
+                to_ox(term[2], cache=cache),
+                to_ox(context, cache=cache),
+            )
+        if len(term) == 4:
+            return ox.Quad(
+                to_ox(term[0], cache=cache),
+                to_ox(term[1], cache=cache),
+                to_ox(term[2], cache=cache),
+                to_ox(term[3], cache=cache),
+            )
+    raise ValueError(f"Unexpected rdflib term: {term!r}")
+
+
+def _to_ox_term(term: Node) -> Union[ox.NamedNode, ox.BlankNode, ox.Literal]:
     if isinstance(term, URIRef):
         return ox.NamedNode(term)
     if isinstance(term, BNode):
@@ -28,28 +87,64 @@ def to_ox(
             language=term.language,
             datatype=ox.NamedNode(term.datatype) if term.datatype else None,
         )
-    if isinstance(term, Graph):
-        return to_ox(term.identifier)
-    if isinstance(term, tuple):
-        if len(term) == 3:
-            return ox.Quad(
-                to_ox(term[0]),
-                to_ox(term[1]),
-                to_ox(term[2]),
-                to_ox(context),
-            )
-        if len(term) == 4:
-            return ox.Quad(
-                to_ox(term[0]),
-                to_ox(term[1]),
-                to_ox(term[2]),
-                to_ox(term[3]),
-            )
     raise ValueError(f"Unexpected rdflib term: {term!r}")
 
 
+def to_ox_quads(quads: Iterable[Union[_Triple, _Quad]], context: Optional[Graph] = None) -> List[ox.Quad]:
+    """Convert a batch of rdflib triples or quads, converting only once the predicates, datatypes and graph names.
+
+    The triples are put in the ``context`` graph.
+    """
+    predicates: Dict[Node, ox.NamedNode] = {}
+    datatypes: Dict[URIRef, ox.NamedNode] = {}
+    graph_names: Dict[Node, Optional[Union[ox.NamedNode, ox.BlankNode, ox.DefaultGraph]]] = {}
+    default_graph_name = to_ox(context)
+    results: List[ox.Quad] = []
+    for quad in quads:
+        predicate = predicates.get(quad[1])
+        if predicate is None:
+            predicate = predicates[quad[1]] = _to_ox_term(quad[1])
+        if len(quad) == 3:
+            graph_name = default_graph_name
+        else:
+            graph_name = graph_names.get(quad[3])  # type: ignore[misc]
+            if graph_name is None:
+                graph_name = graph_names[quad[3]] = to_ox(quad[3])  # type: ignore[misc]
+        results.append(
+            ox.Quad(
+                _to_ox_term_with_datatypes(quad[0], datatypes),
+                predicate,
+                _to_ox_term_with_datatypes(quad[2], datatypes),
+                graph_name,
+            )
+        )
+    return results
+
+
+def _to_ox_term_with_datatypes(
+    term: Node, datatypes: Dict[URIRef, ox.NamedNode]
+) -> Union[ox.NamedNode, ox.BlankNode, ox.Literal]:
+    """Like :func:`_to_ox_term` but reusing the already converted datatypes."""
+    # Exact type checks are much cheaper than isinstance ones
+    term_type = type(term)
+    if term_type is URIRef:
+        return ox.NamedNode(term)
+    if term_type is Literal:
+        if term.datatype is None:  # type: ignore[attr-defined]
+            return ox.Literal(term, language=term.language)  # type: ignore[attr-defined]
+        datatype = datatypes.get(term.datatype)  # type: ignore[attr-defined]
+        if datatype is None:
+            datatype = datatypes[term.datatype] = ox.NamedNode(term.datatype)  # type: ignore[attr-defined]
+        return ox.Literal(term, datatype=datatype)
+    if term_type is BNode:
+        return ox.BlankNode(term)
+    return _to_ox_term(term)
+
+
 def to_ox_quad_pattern(
-    triple: _TriplePattern, context: Optional[Graph] = None
+    triple: _TriplePattern,
+    context: Optional[Graph] = None,
+    cache: Optional[TermCache] = None,
 ) -> Tuple[
     Optional[Union[ox.NamedNode, ox.BlankNode]],
     Optional[ox.NamedNode],
@@ -59,31 +154,24 @@ def to_ox_quad_pattern(
     """Convert an rdflib quad pattern to an Oxigraph quad pattern."""
     (s, p, o) = triple
     return (
-        to_ox_term_pattern(s),
-        to_ox_term_pattern(p),
-        to_ox_term_pattern(o),
-        to_ox_term_pattern(context),
+        to_ox_term_pattern(s, cache),
+        to_ox_term_pattern(p, cache),
+        to_ox_term_pattern(o, cache),
+        to_ox_term_pattern(context, cache),
     )
 
 
 def to_ox_term_pattern(
     term: Optional[Union[URIRef, BNode, Literal, Graph]],
+    cache: Optional[TermCache] = None,
 ) -> Optional[Union[ox.NamedNode, ox.BlankNode, ox.Literal]]:
     if term is None:
         return None
-    if isinstance(term, URIRef):
-        return ox.NamedNode(term)
-    if isinstance(term, BNode):
-        return ox.BlankNode(term)
-    if isinstance(term, Literal):
-        return ox.Literal(
-            term,
-            language=term.language,
-            datatype=ox.NamedNode(term.datatype) if term.datatype else None,
-        )
     if isinstance(term, Graph):
-        return to_ox(term.identifier)
-    raise ValueError(f"Unexpected rdflib term: {term!r}")
+        return to_ox(term.identifier, cache=cache)
+    if cache is not None and isinstance(term, (URIRef, BNode, Literal)):
+        return cache.to_ox(term)
+    return _to_ox_term(term)
 
 
 def from_ox_graph_name(
@@ -99,11 +187,59 @@ def from_ox_graph_name(
     raise ValueError(f"Unexpected Oxigraph graph name: {graph_name!r}")
 
 
+def from_ox_quads(
+    quads: Iterable[ox.Quad],
+    store: Store,
+    cache: Optional[TermCache] = None,
+    graphs: Optional[Dict[Union[ox.NamedNode, ox.BlankNode, ox.DefaultGraph], Graph]] = None,
+) -> List[Tuple[_Triple, Graph]]:
+    """Convert a batch of Oxigraph quads, converting each distinct term and graph name of the batch only once.
+
+    ``graphs`` allows to share the graph objects between batches, it is filled with the graphs created.
+    """
+    convert_term = _from_ox_term if cache is None else cache.from_ox
+
+    def convert(term: Union[ox.NamedNode, ox.BlankNode, ox.Literal, ox.Triple]) -> Node:
+        if isinstance(term, ox.Triple):
+            # Like from_ox, quoted triples are returned as Python tuples
+            return convert(term.subject), convert(term.predicate), convert(term.object)  # type: ignore[return-value]
+        return convert_term(term)
+
+    terms: Dict[Union[ox.NamedNode, ox.BlankNode, ox.Literal, ox.Triple], Node] = {}
+    if graphs is None:
+        graphs = {}
+    results: List[Tuple[_Triple, Graph]] = []
+    for s, p, o, g in quads:
+        rs = terms.get(s)
+        if rs is None:
+            rs = terms[s] = convert(s)
+        rp = terms.get(p)
+        if rp is None:
+            rp = terms[p] = convert(p)
+        ro = terms.get(o)
+        if ro is None:
+            ro = terms[o] = convert(o)
+        rg = graphs.get(g)
+        if rg is None:
+            rg = graphs[g] = from_ox_graph_name(g, store)
+        results.append(((rs, rp, ro), rg))
+    return results
+
+
 def from_ox(
     term: Optional[Union[ox.NamedNode, ox.BlankNode, ox.Literal, ox.Triple]],
+    cache: Optional[TermCache] = None,
 ) -> Optional[Union[Node, Tuple[Node, Node, Node]]]:
     if term is None:
         return None
+    if isinstance(term, ox.Triple):
+        return from_ox(term.subject, cache), from_ox(term.predicate, cache), from_ox(term.object, cache)
+    if cache is not None and isinstance(term, (ox.NamedNode, ox.BlankNode, ox.Literal)):
+        return cache.from_ox(term)
+    return _from_ox_term(term)
+
+
+def _from_ox_term(term: Union[ox.NamedNode, ox.BlankNode, ox.Literal]) -> Node:
     if isinstance(term, ox.NamedNode):
         return URIRef(term.value)
     if isinstance(term, ox.BlankNode):
@@ -112,6 +248,4 @@ def from_ox(
         if term.language:
             return Literal(term.value, lang=term.language)
         return Literal(term.value, datatype=URIRef(term.datatype.value))
-    if isinstance(term, ox.Triple):
-        return from_ox(term.subject), from_ox(term.predicate), from_ox(term.object)
     raise ValueError(f"Unexpected Oxigraph term: {term!r}")
@@ -0,0 +1,61 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Union
+
+import pyoxigraph as ox
+
+METADATA_FILE_NAME = "oxrdflib.json"
+
+
+def load_metadata(directory: Path) -> Dict[str, Any]:
+    """Read the oxrdflib metadata stored next to the Oxigraph data, returning an empty dict if there is none."""
+    try:
+        with (directory / METADATA_FILE_NAME).open(encoding="utf-8") as fp:
+            metadata = json.load(fp)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    return metadata if isinstance(metadata, dict) else {}
+
+
+def save_metadata(directory: Path, metadata: Dict[str, Any]) -> None:
+    """Atomically replace the oxrdflib metadata stored next to the Oxigraph data."""
+    path = directory / METADATA_FILE_NAME
+    if not metadata:
+        path.unlink(missing_ok=True)
+        return
+    tmp_path = path.with_suffix(".tmp")
+    with tmp_path.open("w", encoding="utf-8") as fp:
+        json.dump(metadata, fp)
+    tmp_path.replace(path)
+
+
+def store_fingerprint(directory: Path) -> str:
+    """Hash of the names, sizes and modification times of the Oxigraph files, changed by any write to the store.
+
+    The RocksDB info logs are ignored because they are also written when opening the store read-only.
+    Listing the directory is cheap even for large stores, unlike counting their quads.
+    """
+    digest = hashlib.sha256()
+    for name, size, mtime in sorted(
+        (entry.name, entry.stat().st_size, entry.stat().st_mtime_ns)
+        for entry in os.scandir(directory)
+        if entry.is_file() and not entry.name.startswith(("LOG", "oxrdflib."))
+    ):
+        digest.update(f"{name}\0{size}\0{mtime}\n".encode())
+    return digest.hexdigest()
+
+
+def encode_graph_name(graph_name: Union[ox.NamedNode, ox.BlankNode, ox.DefaultGraph]) -> str:
+    return str(graph_name)
+
+
+def decode_graph_name(value: str) -> Union[ox.NamedNode, ox.BlankNode, ox.DefaultGraph]:
+    if value.startswith("<") and value.endswith(">"):
+        return ox.NamedNode(value[1:-1])
+    if value.startswith("_:"):
+        return ox.BlankNode(value[2:])
+    if value == str(ox.DefaultGraph()):
+        return ox.DefaultGraph()
+    raise ValueError(f"Unexpected graph name in the oxrdflib metadata: {value!r}")
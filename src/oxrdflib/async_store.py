@@ -0,0 +1,210 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from types import TracebackType
+from typing import Any, AsyncIterator, Callable, Iterator, List, Mapping, Optional, Type, TypeVar, Union
+
+import pyoxigraph as ox
+from rdflib import Graph
+from rdflib.graph import DATASET_DEFAULT_GRAPH_ID
+from rdflib.query import Result, ResultRow
+from rdflib.term import Identifier, Node, Variable
+
+from ._converter import TermCache, from_ox, to_ox
+from ._type import _Triple, _TriplePattern
+from .store import DEFAULT_READ_BATCH_SIZE, OxigraphStore
+
+__all__ = ["AsyncOxigraphStore"]
+
+T = TypeVar("T")
+
+
+class AsyncOxigraphStore:
+    """asyncio facade of an :class:`OxigraphStore` running the store operations in a pool of threads.
+
+    At most ``max_workers`` operations run at the same time, the number of CPUs by default.
+    The other ones wait without blocking the event loop until a thread is available.
+    The iterators fetch their results by batches of ``batch_size``, each batch being a separate operation
+    run in a thread dedicated to the iterator, so that a long iteration does not keep a worker for itself.
+    Cancelling or leaving an iteration does not wait for its running batch, which completes in the background.
+    """
+
+    def __init__(self, store: Optional[OxigraphStore] = None, *, max_workers: Optional[int] = None) -> None:
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError(f"The number of workers must be positive, {max_workers} given")
+        self.store = OxigraphStore() if store is None else store
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._executor = ThreadPoolExecutor(self._max_workers)
+        # Created on first use to be bound to the running event loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def query(
+        self,
+        query: str,
+        initNs: Optional[Mapping[str, Any]] = None,  # noqa: N803
+        initBindings: Optional[Mapping[str, Identifier]] = None,  # noqa: N803
+        queryGraph: Union[str, Node] = DATASET_DEFAULT_GRAPH_ID,  # noqa: N803
+        **kwargs: Any,  # noqa: ANN401
+    ) -> Result:
+        """Evaluate a SPARQL query like :meth:`OxigraphStore.query`.
+
+        The solutions of SELECT queries are all fetched before returning, use :meth:`select` to iterate on them.
+        The ``"iterator"`` ``construct_result`` is not supported: the results must be fetched in the worker thread.
+        """
+        if kwargs.get("construct_result") == "iterator":
+            raise ValueError("The 'iterator' CONSTRUCT results can't be used outside of the worker threads")
+
+        def evaluate() -> Result:
+            result = self.store.query(query, initNs or {}, initBindings or {}, queryGraph, **kwargs)
+            if result.type == "SELECT":
+                # Fetches all the solutions
+                result.bindings  # noqa: B018
+            return result
+
+        return await self._run(evaluate)
+
+    async def select(
+        self,
+        query: str,
+        initNs: Optional[Mapping[str, Any]] = None,  # noqa: N803
+        initBindings: Optional[Mapping[str, Identifier]] = None,  # noqa: N803
+        queryGraph: Union[str, Node] = DATASET_DEFAULT_GRAPH_ID,  # noqa: N803
+        *,
+        batch_size: int = DEFAULT_READ_BATCH_SIZE,
+    ) -> AsyncIterator[ResultRow]:
+        """Iterate on the solutions of a SPARQL SELECT query."""
+
+        def evaluate() -> Iterator[ResultRow]:
+            if self.store._pending is not None:
+                raise NotImplementedError("Oxigraph can't evaluate SPARQL queries on uncommitted changes")
+            # The solutions are iterated directly: an rdflib Result would keep them in a reference cycle
+            # that the garbage collector might free in another thread
+            solutions = self.store._evaluate(query, initNs or {}, initBindings or {}, queryGraph, None)
+            if not isinstance(solutions, ox.QuerySolutions):
+                raise ValueError("Only SELECT queries are supported")
+            return _result_rows(solutions, self.store._term_cache)
+
+        async for row in self._iterate(evaluate, batch_size):
+            yield row
+
+    async def update(
+        self,
+        update: str,
+        initNs: Optional[Mapping[str, Any]] = None,  # noqa: N803
+    ) -> None:
+        """Evaluate a SPARQL update on the default graph like :meth:`OxigraphStore.update`."""
+        await self._run(self.store.update, update, initNs or {}, {}, DATASET_DEFAULT_GRAPH_ID)
+
+    async def triples(
+        self,
+        triple_pattern: _TriplePattern,
+        context: Optional[Graph] = None,
+        *,
+        batch_size: int = DEFAULT_READ_BATCH_SIZE,
+    ) -> AsyncIterator[_Triple]:
+        """Iterate on the triples matching the pattern, in all graphs if ``context`` is ``None``."""
+
+        def triples() -> Iterator[_Triple]:
+            return (triple for triple, _ in self.store.triples(triple_pattern, context))
+
+        async for triple in self._iterate(triples, batch_size):
+            yield triple
+
+    async def load(
+        self,
+        path: Union[str, Path],
+        format: ox.RdfFormat,  # noqa: A002
+        graph: Optional[Union[Graph, Identifier]] = None,
+        *,
+        bulk: bool = False,
+    ) -> None:
+        """Load a file into a graph, the default graph if ``graph`` is ``None``.
+
+        With ``bulk``, the faster but non-transactional Oxigraph bulk loader is used.
+        """
+
+        def load() -> None:
+            self.store._load(
+                path=str(path),
+                format=format,
+                base_iri=Path(path).absolute().as_uri(),
+                to_graph=ox.DefaultGraph() if graph is None else to_ox(graph),
+                bulk=bulk,
+            )
+
+        await self._run(load)
+
+    async def dump(
+        self,
+        path: Union[str, Path],
+        format: ox.RdfFormat,  # noqa: A002
+        graph: Optional[Union[Graph, Identifier]] = None,
+    ) -> None:
+        """Write a graph to a file or, if ``graph`` is ``None``, the whole store using a dataset format."""
+        await self._run(
+            partial(
+                self.store._inner.dump,
+                output=str(path),
+                format=format,
+                from_graph=None if graph is None else to_ox(graph),
+            )
+        )
+
+    async def close(self, commit_pending_transaction: bool = False) -> None:
+        """Close the store once the running operations are done."""
+        await self._run(self.store.close, commit_pending_transaction)
+        self._executor.shutdown(wait=False)
+
+    async def __aenter__(self) -> "AsyncOxigraphStore":  # noqa: PYI034
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+    async def _run(self, fn: Callable[..., T], *args: Any, executor: Optional[ThreadPoolExecutor] = None) -> T:  # noqa: ANN401
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_workers)
+        async with self._semaphore:
+            return await asyncio.get_running_loop().run_in_executor(executor or self._executor, partial(fn, *args))
+
+    async def _iterate(self, iterator: Callable[[], Iterator[T]], batch_size: int) -> AsyncIterator[T]:
+        if batch_size <= 0:
+            raise ValueError(f"The batch size must be positive, {batch_size} given")
+        # pyoxigraph iterators must be used and dropped in the thread that created them
+        iterators: List[Iterator[T]] = []
+
+        def drop() -> None:
+            for it in iterators:
+                close = getattr(it, "close", None)
+                if close is not None:
+                    close()
+            iterators.clear()
+
+        executor = ThreadPoolExecutor(1)
+        try:
+            # The iterator is built in the thread too, the query evaluation might already be slow
+            await self._run(lambda: iterators.append(iterator()), executor=executor)
+            while True:
+                batch: List[T] = await self._run(lambda: list(islice(iterators[0], batch_size)), executor=executor)
+                for item in batch:
+                    yield item
+                if len(batch) < batch_size:
+                    return
+        finally:
+            # The iterator is dropped after the running batch without waiting for it, e.g. on cancellation
+            executor.submit(drop)
+            executor.shutdown(wait=False)
+
+
+def _result_rows(solutions: ox.QuerySolutions, cache: Optional[TermCache]) -> Iterator[ResultRow]:
+    variables = [Variable(v.value) for v in solutions.variables]
+    for solution in solutions:
+        yield ResultRow({v: from_ox(value, cache) for v, value in zip(variables, solution)}, variables)
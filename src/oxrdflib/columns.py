@@ -0,0 +1,119 @@
+from array import array
+from contextlib import suppress
+from enum import IntEnum
+from itertools import islice
+from typing import Dict, List, NamedTuple, Optional, Sequence, Union
+
+import pyoxigraph as ox
+
+__all__ = ["Column", "ColumnarResult", "TermKind"]
+
+DEFAULT_COLUMN_BATCH_SIZE = 1024
+
+_XSD = "http://www.w3.org/2001/XMLSchema#"
+_NUMERIC_DATATYPES = frozenset(
+    _XSD + name
+    for name in (
+        "decimal",
+        "double",
+        "float",
+        "integer",
+        "int",
+        "long",
+        "short",
+        "byte",
+        "nonNegativeInteger",
+        "nonPositiveInteger",
+        "negativeInteger",
+        "positiveInteger",
+        "unsignedLong",
+        "unsignedInt",
+        "unsignedShort",
+        "unsignedByte",
+    )
+)
+
+
+class TermKind(IntEnum):
+    """Kind of the term bound to a variable in a :class:`Column`."""
+
+    UNBOUND = 0
+    NAMED_NODE = 1
+    BLANK_NODE = 2
+    LITERAL = 3
+    TRIPLE = 4
+
+
+class Column(NamedTuple):
+    """The values bound to a variable by the solutions of a SELECT query, one array entry per solution.
+
+    ``values`` contains the IRIs, the blank node identifiers, the literal lexical forms
+    and the N-Triples serialization of the quoted triples.
+    ``numbers`` contains the value of the literals with a xsd numeric datatype and NaN for the other terms.
+    """
+
+    kinds: "array[int]"
+    values: List[Optional[str]]
+    datatypes: List[Optional[str]]
+    languages: List[Optional[str]]
+    numbers: "array[float]"
+
+
+class ColumnarResult(NamedTuple):
+    """The solutions of a SELECT query stored with one :class:`Column` per variable."""
+
+    variables: List[str]
+    columns: Dict[str, Column]
+    row_count: int
+
+
+def columns_from_solutions(solutions: ox.QuerySolutions, batch_size: int = DEFAULT_COLUMN_BATCH_SIZE) -> ColumnarResult:
+    """Fill the columns by batches of solutions, without building rdflib terms."""
+    variables = [v.value for v in solutions.variables]
+    columns = [Column(array("B"), [], [], [], array("d")) for _ in variables]
+    row_count = 0
+    while True:
+        batch = list(islice(solutions, batch_size))
+        if not batch:
+            return ColumnarResult(variables, dict(zip(variables, columns)), row_count)
+        row_count += len(batch)
+        for i, column in enumerate(columns):
+            _extend_column(column, [solution[i] for solution in batch])
+
+
+def _extend_column(
+    column: Column, terms: Sequence[Optional[Union[ox.NamedNode, ox.BlankNode, ox.Literal, ox.Triple]]]
+) -> None:
+    kinds, values, datatypes, languages, numbers = column
+    nan = float("nan")
+    for term in terms:
+        datatype = None
+        language = None
+        number = nan
+        if term is None:
+            kind = TermKind.UNBOUND
+            value = None
+        elif isinstance(term, ox.Literal):
+            kind = TermKind.LITERAL
+            value = term.value
+            language = term.language
+            datatype = term.datatype.value
+            if datatype in _NUMERIC_DATATYPES:
+                with suppress(ValueError):  # Invalid lexical forms are kept as NaN
+                    number = float(value)
+        elif isinstance(term, ox.NamedNode):
+            kind = TermKind.NAMED_NODE
+            value = term.value
+        elif isinstance(term, ox.BlankNode):
+            kind = TermKind.BLANK_NODE
+            value = term.value
+        elif isinstance(term, ox.Triple):
+            kind = TermKind.TRIPLE
+            value = str(term)
+        else:
+            raise ValueError(f"Unexpected Oxigraph term: {term!r}")
+        kinds.append(kind)
+        values.append(value)
+        datatypes.append(datatype)
+        languages.append(language)
+        numbers.append(number)
@@ -1,10 +1,38 @@
+import bz2
+import gzip
+import lzma
+import os
 from abc import ABC, abstractmethod
-from typing import Final, Optional
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from io import BufferedReader, BytesIO, StringIO
+from itertools import islice
+from pathlib import Path
+from time import perf_counter
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Final,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
+from uuid import uuid4
 
-from pyoxigraph import DefaultGraph, RdfFormat, parse
+from pyoxigraph import BlankNode, DefaultGraph, Literal, NamedNode, Quad, RdfFormat, Triple, parse
 from rdflib import Graph
 from rdflib.exceptions import ParserError
 from rdflib.parser import (
+    BytesIOWrapper,
     FileInputSource,
     InputSource,
     Parser,
@@ -12,10 +40,18 @@ from rdflib.parser import (
     create_input_source,
 )
 
-from oxrdflib._converter import from_ox, from_ox_graph_name, to_ox
+from oxrdflib._converter import TermCache, from_ox_quads, to_ox
 from oxrdflib.store import OxigraphStore
 
+T = TypeVar("T")
+
+_LINE_BASED_FORMATS = (RdfFormat.N_TRIPLES, RdfFormat.N_QUADS)
+_PARALLEL_CHUNK_SIZE = 16 * 1024 * 1024
+_SINK_BATCH_SIZE = 10_000
+DEFAULT_BULK_LOAD_THRESHOLD = 256 * 1024 * 1024
+
 __all__ = [
+    "LoadProgress",
     "OxigraphJsonLdParser",
     "OxigraphN3Parser",
     "OxigraphNQuadsParser",
@@ -27,6 +63,22 @@ __all__ = [
 ]
 
 
+class LoadProgress(NamedTuple):
+    """Progress of a parsing, given to the ``progress`` callback of the Oxigraph parsers."""
+
+    quads: int
+    bytes_read: int
+    seconds: float
+
+    @property
+    def quads_per_second(self) -> float:
+        return self.quads / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes_read / self.seconds if self.seconds > 0 else 0.0
+
+
 class _OxigraphParser(Parser, ABC):
     def parse(
         self,
@@ -34,10 +86,31 @@ class _OxigraphParser(Parser, ABC):
         sink: Graph,
         *,
         encoding: Optional[str] = "utf-8",
-        transactional: bool = True,
+        transactional: Optional[bool] = None,
+        workers: Optional[int] = None,
+        progress: Optional[Callable[[LoadProgress], None]] = None,
+        bulk_load_threshold: int = DEFAULT_BULK_LOAD_THRESHOLD,
     ) -> None:
+        """Parse the source into the sink.
+
+        If ``transactional`` is ``None``, the files of at least ``bulk_load_threshold`` bytes
+        are loaded into Oxigraph stores with the faster but non-transactional bulk loader.
+
+        With ``workers``, N-Triples and N-Quads inputs are split at line boundaries
+        and the chunks are parsed and loaded in parallel by this number of threads.
+        Each chunk is then loaded in its own transaction.
+
+        ``progress`` is called after each batch of loaded quads with the progress of the parsing.
+        With a transactional load into an Oxigraph store, the batches are only written at the end of the parsing.
+
+        gzip, bzip2, xz and Zstandard compressed files are detected from their first bytes and decompressed on the fly.
+
+        Files are read by Oxigraph itself and in-memory strings and bytes are given as a single buffer to Oxigraph.
+        """
         if encoding not in (None, "utf-8"):
             raise ParserError(f"Only the 'utf-8' encoding is supported, '{encoding}' given")
+        if workers is not None and workers > 1 and self._format not in _LINE_BASED_FORMATS:
+            raise ParserError(f"Parallel parsing is only supported for N-Triples and N-Quads, not {self._format}")
         base_iri = sink.absolutize(source.getPublicId() or source.getSystemId() or "")
         args = {
             "format": self._format,
@@ -46,28 +119,16 @@ class _OxigraphParser(Parser, ABC):
 
         if isinstance(source, URLInputSource):
             source = create_input_source(source.url, format=self._format.file_extension)
-        if isinstance(source, FileInputSource):
-            args["path"] = source.file.name
+        if transactional is None:
+            size = _file_size(source)
+            transactional = size is None or size < bulk_load_threshold
+        loader = _Loader(sink, args, bulk=not transactional, progress=progress)
+        path = _source_path(source)
+        if path is not None:
+            loader.load_path(path, workers)
         else:
-            args["input"] = source.getByteStream()
-
-        if isinstance(sink.store, OxigraphStore):
-            if transactional:
-                sink.store._inner.load(**args, to_graph=to_ox(sink.identifier))
-            else:
-                sink.store._inner.bulk_load(**args, to_graph=to_ox(sink.identifier))
-        else:
-            sink.store.addN(
-                (
-                    from_ox(quad.subject),
-                    from_ox(quad.predicate),
-                    from_ox(quad.object),
-                    sink
-                    if isinstance(quad.graph_name, DefaultGraph)
-                    else from_ox_graph_name(quad.graph_name, sink.store),
-                )
-                for quad in parse(**args)
-            )
+            loader.load(source.getByteStream(), workers)
+        loader.report()
 
     @property
     @abstractmethod
@@ -75,6 +136,260 @@ class _OxigraphParser(Parser, ABC):
         pass
 
 
+class _Loader:
+    """Load the parsed quads into a sink and keep track of the progress."""
+
+    def __init__(
+        self,
+        sink: Graph,
+        args: Dict[str, Any],
+        *,
+        bulk: bool,
+        progress: Optional[Callable[[LoadProgress], None]],
+    ) -> None:
+        self._sink = sink
+        self._args = args
+        self._bulk = bulk
+        self._progress = progress
+        self._default_graph = to_ox(sink.identifier)
+        # pyoxigraph load gives new labels to the blank nodes on each call, we do the same when adding parsed quads
+        self._scope = uuid4().hex
+        self._cache = TermCache()
+        # A single graph object per graph name, the default graph being the sink
+        self._graphs: Dict[Union[NamedNode, BlankNode, DefaultGraph], Graph] = {DefaultGraph(): sink}
+        self._quads = 0
+        self.bytes_read = 0
+        self._start = perf_counter()
+
+    @property
+    def _oxigraph_store(self) -> Optional[OxigraphStore]:
+        return self._sink.store if isinstance(self._sink.store, OxigraphStore) else None
+
+    def load_path(self, path: Path, workers: Optional[int]) -> None:
+        decompressed = _open_decompressed(path)
+        if decompressed is not None:
+            with decompressed as fp:
+                self.load(fp, workers)
+            return
+        if self._progress is None and (workers is None or workers <= 1):
+            # Oxigraph reads the file itself
+            store = self._oxigraph_store
+            if store is not None:
+                store._load(path=str(path), to_graph=self._default_graph, bulk=self._bulk, **self._args)
+            else:
+                self._add(parse(path=str(path), **self._args))
+            return
+        with path.open("rb") as fp:
+            self.load(fp, workers)
+
+    def load(self, stream: IO[Any], workers: Optional[int]) -> None:
+        if workers is not None and workers > 1:
+            self._load_parallel(stream, workers)
+            return
+        if self._progress is not None:
+            self._add(parse(input=_CountingReader(stream, self), **self._args))
+            return
+        # No need to make Oxigraph read in-memory data through Python read() calls
+        data = _in_memory_data(stream)
+        if data is None:
+            data = stream
+        store = self._oxigraph_store
+        if store is not None:
+            store._load(input=data, to_graph=self._default_graph, bulk=self._bulk, **self._args)
+        else:
+            self._add(parse(input=data, **self._args))
+
+    def _load_parallel(self, stream: IO[Any], workers: int) -> None:
+        chunks = _line_chunks(stream, _PARALLEL_CHUNK_SIZE)
+        with ThreadPoolExecutor(workers) as executor:
+            if self._oxigraph_store is not None:
+                for size, quads in _map_bounded(executor, self._load_chunk, chunks, workers):
+                    self.bytes_read += size
+                    self._quads += quads
+                    self.report()
+            else:
+                # The chunks are parsed in parallel but added in order, the blank node labels are shared by the chunks
+                for size, parsed in _map_bounded(executor, self._parse_chunk, chunks, workers):
+                    self.bytes_read += size
+                    self._add(parsed)
+
+    def _load_chunk(self, chunk: bytes) -> Tuple[int, int]:
+        """Load a chunk into the Oxigraph store, returning its size and, if counted, its number of quads."""
+        store = cast("OxigraphStore", self._oxigraph_store)
+        if b"_:" not in chunk and self._progress is None:
+            # No blank node to share with the other chunks, pyoxigraph can do everything without taking the GIL
+            store._load(input=chunk, to_graph=self._default_graph, bulk=self._bulk, **self._args)
+            return len(chunk), 0
+        quads = [self._scope_quad(quad) for quad in parse(input=chunk, **self._args)]
+        store._extend(quads, bulk=self._bulk)  # pyoxigraph releases the GIL while writing
+        return len(chunk), len(quads)
+
+    def _parse_chunk(self, chunk: bytes) -> Tuple[int, List[Quad]]:
+        return len(chunk), list(parse(input=chunk, **self._args))
+
+    def _add(self, quads: Iterable[Quad]) -> None:
+        """Add the quads with a write per batch.
+
+        Transactional loads into an Oxigraph store are written at once after parsing everything,
+        so that a syntax error does not leave the first batches loaded.
+        """
+        store = self._oxigraph_store
+        staged: List[Quad] = []
+        quads = iter(quads)
+        while True:
+            if store is not None:
+                batch = [self._scope_quad(quad) for quad in islice(quads, _SINK_BATCH_SIZE)]
+                if self._bulk:
+                    if batch:
+                        store._extend(batch, bulk=True)
+                elif batch:
+                    staged.extend(batch)
+                elif staged:
+                    store._extend(staged)
+            else:
+                batch = from_ox_quads(islice(quads, _SINK_BATCH_SIZE), self._sink.store, self._cache, self._graphs)
+                if batch:
+                    self._sink.store.addN((s, p, o, g) for (s, p, o), g in batch)
+            if not batch:
+                return
+            self._quads += len(batch)
+            self.report()
+
+    def _scope_quad(self, quad: Quad) -> Quad:
+        subject, predicate, obj, graph_name = quad
+        if isinstance(graph_name, DefaultGraph):
+            graph_name = self._default_graph
+        elif isinstance(graph_name, BlankNode):
+            graph_name = _scope_term(graph_name, self._scope)
+        elif not isinstance(subject, (BlankNode, Triple)) and not isinstance(obj, (BlankNode, Triple)):
+            return quad  # Nothing to change
+        return Quad(_scope_term(subject, self._scope), predicate, _scope_term(obj, self._scope), graph_name)
+
+    def report(self) -> None:
+        if self._progress is not None:
+            self._progress(LoadProgress(self._quads, self.bytes_read, perf_counter() - self._start))
+
+
+class _CountingReader:
+    """Wrap a stream to count the bytes read from it."""
+
+    def __init__(self, stream: IO[Any], loader: _Loader) -> None:
+        self._stream = stream
+        self._loader = loader
+
+    def read(self, size: int = -1) -> Union[bytes, str]:
+        data = self._stream.read(size)
+        self._loader.bytes_read += len(data)
+        return data
+
+
+def _open_decompressed(path: Path) -> Optional[IO[bytes]]:
+    """Open the file with a streaming decompressor if its magic bytes show it is compressed, return None if not."""
+    with path.open("rb") as fp:
+        magic = fp.read(6)
+    if magic.startswith(b"\x1f\x8b"):
+        return gzip.open(path, "rb")
+    if magic.startswith(b"BZh") and magic[3:4].isdigit():
+        return bz2.open(path, "rb")
+    if magic.startswith(b"\xfd7zXZ\x00"):
+        return lzma.open(path, "rb")
+    if magic.startswith(b"\x28\xb5\x2f\xfd"):
+        return _open_zstd(path)
+    return None
+
+
+def _open_zstd(path: Path) -> IO[bytes]:
+    try:
+        from compression import zstd  # Python 3.14+
+    except ImportError:
+        try:
+            import zstandard
+        except ImportError:
+            raise ParserError(
+                "Zstandard compressed files require Python 3.14+ or the zstandard package (oxrdflib[zstd] extra)"
+            ) from None
+        # The zstandard reader does not implement readline(), used to split the input in chunks of lines
+        return BufferedReader(zstandard.ZstdDecompressor().stream_reader(path.open("rb"), closefd=True))
+    return zstd.open(path, "rb")
+
+
+def _source_path(source: InputSource) -> Optional[Path]:
+    """The path of the file read by the source if it is a local file that has not been read yet."""
+    if not isinstance(source, FileInputSource):
+        return None
+    name = getattr(source.file, "name", None)
+    if not isinstance(name, str):
+        return None  # e.g. file descriptors and anonymous temporary files
+    try:
+        if source.file.tell() != 0:
+            return None
+    except (AttributeError, OSError, ValueError):
+        return None
+    path = Path(name)
+    return path if path.is_file() else None
+
+
+def _in_memory_data(stream: IO[Any]) -> Optional[Union[bytes, str]]:
+    """The remaining content of the stream if it is already in memory, None if it has to be read."""
+    if isinstance(stream, BytesIOWrapper):
+        if getattr(stream, "enc_str", None) is not None or getattr(stream, "text_str", None) is not None:
+            return None  # Already started to be read
+        stream = stream.wrapped
+        if isinstance(stream, str):
+            return stream
+    if isinstance(stream, (BytesIO, StringIO)):
+        position = stream.tell()
+        # getvalue() does not copy the BytesIO buffer, unlike read()
+        return stream.getvalue()[position:] if position else stream.getvalue()
+    return None
+
+
+def _file_size(source: InputSource) -> Optional[int]:
+    if not isinstance(source, FileInputSource):
+        return None
+    try:
+        return os.fstat(source.file.fileno()).st_size
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _line_chunks(stream: IO[Any], chunk_size: int) -> Iterator[bytes]:
+    """Split the stream in chunks of about ``chunk_size`` bytes ending at line boundaries."""
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            return
+        chunk += stream.readline()
+        yield chunk.encode() if isinstance(chunk, str) else chunk
+
+
+def _map_bounded(
+    executor: ThreadPoolExecutor, fn: Callable[[bytes], T], chunks: Iterable[bytes], workers: int
+) -> Iterator[T]:
+    """Like :meth:`ThreadPoolExecutor.map` but only reading the chunks that are about to be processed."""
+    futures: Deque[Future[T]] = deque()
+    try:
+        for chunk in chunks:
+            futures.append(executor.submit(fn, chunk))
+            if len(futures) >= 2 * workers:
+                yield futures.popleft().result()
+        while futures:
+            yield futures.popleft().result()
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def _scope_term(
+    term: Union[NamedNode, BlankNode, Literal, Triple], scope: str
+) -> Union[NamedNode, BlankNode, Literal, Triple]:
+    if isinstance(term, BlankNode):
+        return BlankNode(f"{scope}{term.value}")
+    if isinstance(term, Triple):
+        return Triple(_scope_term(term.subject, scope), term.predicate, _scope_term(term.object, scope))
+    return term
+
+
 class OxigraphJsonLdParser(_OxigraphParser):
     _format: Final = RdfFormat.JSON_LD
 
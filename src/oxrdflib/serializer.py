@@ -1,19 +1,24 @@
 from abc import ABC, abstractmethod
-from typing import IO, Final, Optional
+from itertools import islice
+from typing import IO, Final, Iterable, Iterator, Optional, Union
 
-from pyoxigraph import RdfFormat, serialize
+from pyoxigraph import Quad, RdfFormat, serialize
 from rdflib import Dataset
 from rdflib.serializer import Serializer
 
-from oxrdflib._converter import to_ox
+from oxrdflib._converter import to_ox, to_ox_quads
+from oxrdflib._type import _Quad, _Triple
 from oxrdflib.store import OxigraphStore
 
+_BATCH_SIZE = 10_000
+
 __all__ = [
     "OxigraphJsonLdSerializer",
     "OxigraphN3Serializer",
     "OxigraphNQuadsSerializer",
     "OxigraphNTriplesSerializer",
     "OxigraphRdfXmlSerializer",
+    "OxigraphStreamingJsonLdSerializer",
     "OxigraphTriGSerializer",
     "OxigraphTurtleSerializer",
 ]
@@ -40,7 +45,13 @@ class _OxigraphSerializer(Serializer, ABC):
                 prefixes=prefixes,
             )
         else:
-            serialize((to_ox(q) for q in self.store), stream, format=self._format, base_iri=base_iri, prefixes=prefixes)
+            serialize(
+                _to_ox_batches(self.store),
+                stream,
+                format=self._format,
+                base_iri=base_iri,
+                prefixes=prefixes,
+            )
 
     @property
     @abstractmethod
@@ -48,10 +59,24 @@ class _OxigraphSerializer(Serializer, ABC):
         pass
 
 
+def _to_ox_batches(quads: Iterable[Union[_Triple, _Quad]]) -> Iterator[Quad]:
+    """Convert the quads lazily, by batches sharing the conversion of their repeated terms."""
+    quads = iter(quads)
+    while True:
+        batch = to_ox_quads(islice(quads, _BATCH_SIZE))
+        if not batch:
+            return
+        yield from batch
+
+
 class OxigraphJsonLdSerializer(_OxigraphSerializer):
     _format: Final = RdfFormat.JSON_LD
 
 
+class OxigraphStreamingJsonLdSerializer(_OxigraphSerializer):
+    _format: Final = RdfFormat.STREAMING_JSON_LD
+
+
 class OxigraphN3Serializer(_OxigraphSerializer):
     _format: Final = RdfFormat.N3
 
@@ -1,35 +1,219 @@
+import json
+import os
 import shutil
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import chain, islice
 from pathlib import Path
+from threading import Lock
 from typing import (
+    TYPE_CHECKING,
     Any,
     Dict,
+    FrozenSet,
     Generator,
     Iterable,
     Iterator,
+    List,
     Mapping,
     Optional,
+    Set,
     Tuple,
     Union,
+    cast,
 )
+from urllib.parse import parse_qsl
 
 import pyoxigraph as ox
 from rdflib import Graph
 from rdflib.graph import DATASET_DEFAULT_GRAPH_ID
-from rdflib.plugins.sparql.sparql import Query, Update
 from rdflib.query import Result
 from rdflib.store import VALID_STORE, Store
 from rdflib.term import Identifier, Node, URIRef, Variable
 
+from ._cache import CacheInfo, LruCache
 from ._converter import (
+    TermCache,
     from_ox,
     from_ox_graph_name,
+    from_ox_quads,
     to_ox,
     to_ox_quad_pattern,
 )
+from ._metadata import decode_graph_name, encode_graph_name, load_metadata, save_metadata, store_fingerprint
 from ._type import _Quad, _Triple, _TriplePattern
+from .columns import DEFAULT_COLUMN_BATCH_SIZE, ColumnarResult, columns_from_solutions
+
+if TYPE_CHECKING:
+    # The rdflib SPARQL engine is slow to import and not needed at runtime
+    from rdflib.plugins.sparql.sparql import Query, Update
 
 __all__ = ["OxigraphStore"]
 
+DEFAULT_READ_BATCH_SIZE = 1024
+DEFAULT_WRITE_BATCH_SIZE = 10_000
+DEFAULT_QUERY_CACHE_SIZE = 128
+EXPORT_MANIFEST_FILE_NAME = "manifest.json"
+_FIRST_READ_BATCH_SIZE = 16
+_CONSTRUCT_RESULTS = ("graph", "store", "iterator")
+_OPEN_MODES = ("read_write", "read_only", "bulk")
+# Number of namespace binding changes after which the bindings are written to the on-disk store
+_BINDINGS_SAVE_BATCH_SIZE = 1024
+_INT_OPTIONS = ("term_cache_size", "query_cache_size", "read_batch_size", "write_batch_size", "query_workers")
+
+
+class _PendingChanges:
+    """The writes of a not yet committed transaction of an :class:`OxigraphStore` that is not in autocommit mode."""
+
+    def __init__(self) -> None:
+        # An in-memory Oxigraph store to get pattern matching on the staged additions for free
+        self.additions = ox.Store()
+        self.removals: Set[ox.Quad] = set()
+        self.removed_graphs: Set[Union[ox.NamedNode, ox.BlankNode]] = set()
+
+    def add(self, quads: List[ox.Quad]) -> None:
+        self.removals.difference_update(quads)
+        self.additions.extend(quads)
+
+    def remove(self, quads: List[ox.Quad]) -> None:
+        for quad in quads:
+            self.additions.remove(quad)
+        self.removals.update(quads)
+
+    def quads_for_pattern(
+        self,
+        store: ox.Store,
+        pattern: Tuple[
+            Optional[Union[ox.NamedNode, ox.BlankNode]],
+            Optional[ox.NamedNode],
+            Optional[Union[ox.NamedNode, ox.BlankNode, ox.Literal]],
+            Optional[Union[ox.NamedNode, ox.BlankNode, ox.DefaultGraph]],
+        ],
+    ) -> Iterator[ox.Quad]:
+        """The quads of ``store`` matching the pattern as if the pending changes were applied to it."""
+        additions = self.additions
+        removals = self.removals
+        for quad in store.quads_for_pattern(*pattern):
+            if quad not in removals and quad not in additions:
+                yield quad
+        yield from additions.quads_for_pattern(*pattern)
+
+    def triple_count_delta(
+        self, store: ox.Store, graph_name: Optional[Union[ox.NamedNode, ox.BlankNode, ox.DefaultGraph]]
+    ) -> int:
+        """How many triples the pending changes add to a graph of ``store``, or to the union of its graphs if ``None``.
+
+        Only the staged quads are visited, not the whole store.
+        """
+        if graph_name is not None:
+            added = sum(
+                1 for quad in self.additions.quads_for_pattern(None, None, None, graph_name) if quad not in store
+            )
+            removed = sum(1 for quad in self.removals if quad.graph_name == graph_name and quad in store)
+            return added - removed
+        delta = 0
+        for triple in {quad.triple for quad in chain(self.additions, self.removals)}:
+            pattern = (triple.subject, triple.predicate, triple.object)
+            before = after = False
+            for quad in store.quads_for_pattern(*pattern):
+                before = True
+                if quad not in self.removals:
+                    after = True
+                    break
+            if not after:
+                after = next(self.additions.quads_for_pattern(*pattern), None) is not None
+            delta += after - before
+        return delta
+
+    def named_graphs(self, store: ox.Store) -> Iterator[Union[ox.NamedNode, ox.BlankNode]]:
+        additions = self.additions
+        for graph_name in store.named_graphs():
+            if graph_name not in self.removed_graphs and not additions.contains_named_graph(graph_name):
+                yield graph_name
+        yield from additions.named_graphs()
+
+    def apply(self, store: ox.Store) -> None:
+        """Write the pending changes to ``store``, in a single transaction if possible."""
+        additions = list(self.additions)
+        added_graphs = list(self.additions.named_graphs())
+        if not self.removals and not self.removed_graphs:
+            for graph_name in added_graphs:
+                store.add_graph(graph_name)
+            store.extend(additions)
+            return
+        if not any(
+            _has_blank_node(term) for term in chain(self.removals, self.removed_graphs, additions, added_graphs)
+        ):
+            operations = [f"DROP SILENT GRAPH {graph_name}" for graph_name in self.removed_graphs]
+            if self.removals:
+                operations.append(f"DELETE DATA {{ {' '.join(_sparql_quad(quad) for quad in self.removals)} }}")
+            operations.extend(f"CREATE SILENT GRAPH {graph_name}" for graph_name in added_graphs)
+            if additions:
+                operations.append(f"INSERT DATA {{ {' '.join(_sparql_quad(quad) for quad in additions)} }}")
+            store.update(" ; ".join(operations))
+            return
+        # SPARQL can't refer to a given blank node, the changes are written in multiple transactions
+        for graph_name in self.removed_graphs:
+            store.remove_graph(graph_name)
+        for quad in self.removals:
+            store.remove(quad)
+        for graph_name in added_graphs:
+            store.add_graph(graph_name)
+        store.extend(additions)
+
+
+def _has_blank_node(term: Union[ox.NamedNode, ox.BlankNode, ox.Literal, ox.Triple, ox.Quad]) -> bool:
+    if isinstance(term, ox.BlankNode):
+        return True
+    if isinstance(term, (ox.Triple, ox.Quad)):
+        return any(_has_blank_node(t) for t in term)
+    return False
+
+
+def _original_text(
+    parsed: Union["Query", "Update"],
+    initNs: Mapping[str, Any],  # noqa: N803
+) -> Tuple[str, Mapping[str, Any], Optional[str]]:
+    """The SPARQL string, prefixes and base IRI a query or update has been prepared from."""
+    # rdflib prepareQuery and prepareUpdate keep their arguments, the parsed algebra can't be given to Oxigraph
+    original_args = getattr(parsed, "_original_args", None)
+    if original_args is None:
+        raise NotImplementedError(
+            "Only the Queries and Updates built by rdflib prepareQuery and prepareUpdate are supported by Oxigraph"
+        )
+    text, prepared_ns, base = original_args
+    return text, dict(initNs, **prepared_ns), base
+
+
+def _parse_configuration(configuration: Union[str, Mapping[str, Any]]) -> Tuple[str, Dict[str, Any]]:
+    """Split the :meth:`OxigraphStore.open` configuration between the path and the options."""
+    if isinstance(configuration, Mapping):
+        options = dict(configuration)
+        if "path" not in options:
+            raise ValueError("The configuration must contain the store path")
+        path = options.pop("path")
+    else:
+        path, _, query = configuration.partition("?")
+        options = dict(parse_qsl(query, keep_blank_values=True, strict_parsing=bool(query)))
+    for name, value in options.items():
+        if not isinstance(value, str):
+            continue
+        if name in _INT_OPTIONS:
+            try:
+                options[name] = int(value)
+            except ValueError:
+                raise ValueError(f"The {name} option must be an integer, {value!r} given") from None
+        elif name == "autocommit":
+            if value.lower() not in ("true", "false", "1", "0"):
+                raise ValueError(f"The autocommit option must be a boolean, {value!r} given")
+            options[name] = value.lower() in ("true", "1")
+    return str(path), options
+
+
+def _sparql_quad(quad: ox.Quad) -> str:
+    if isinstance(quad.graph_name, ox.DefaultGraph):
+        return f"{quad.triple} ."
+    return f"GRAPH {quad.graph_name} {{ {quad.triple} }}"
+
 
 class OxigraphStore(Store):
     context_aware: bool = True
@@ -43,30 +227,180 @@ class OxigraphStore(Store):
         identifier: Optional[Identifier] = None,
         *,
         store: Optional[ox.Store] = None,
+        term_cache_size: Optional[int] = None,
+        query_cache_size: Optional[int] = DEFAULT_QUERY_CACHE_SIZE,
+        read_batch_size: int = DEFAULT_READ_BATCH_SIZE,
+        write_batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+        autocommit: bool = True,
+        query_workers: Optional[int] = None,
     ) -> None:
         self._store = store
+        self._path: Optional[Path] = None
+        self._read_only = False
+        # File loads and batch additions use the non-transactional Oxigraph bulk loader
+        self._bulk_writes = False
+        # Number of distinct triples per graph name, None being the union of all graphs.
+        # They are only tracked if this store owns the Oxigraph store so that no one else can write to it.
+        self._track_triple_counts = store is None
+        self._triple_counts: Dict[Optional[Union[ox.NamedNode, ox.BlankNode, ox.DefaultGraph]], int] = {}
+        self._read_batch_size = read_batch_size
+        self._write_batch_size = write_batch_size
+        self._term_cache: Optional[TermCache] = None
+        # Prefixes used by the recent query and update strings for a version of the bound prefixes
+        self._query_cache: Optional[LruCache[Tuple[str, FrozenSet[Tuple[str, Any]], int], Dict[str, str]]] = None
+        # Evaluates the queries given to submit_query, created on first use
+        self._query_workers = query_workers
+        self._query_executor: Optional[ThreadPoolExecutor] = None
+        self._query_executor_lock = Lock()
+        # Without autocommit, the writes are staged until commit() is called
+        self._autocommit = autocommit
+        self._pending: Optional[_PendingChanges] = None
+        self._configure(
+            {
+                "term_cache_size": term_cache_size,
+                "query_cache_size": query_cache_size,
+                "read_batch_size": read_batch_size,
+                "write_batch_size": write_batch_size,
+                "autocommit": autocommit,
+                "query_workers": query_workers,
+            }
+        )
+        # The bindings are replaced and never mutated so that they can be read without locking
         self._prefix_for_namespace: Dict[URIRef, str] = {}
         self._namespace_for_prefix: Dict[str, URIRef] = {}
+        self._bindings_version = 0
+        self._bindings_lock = Lock()
+        # Number of binding changes not written yet to the on-disk store metadata
+        self._unsaved_bindings = 0
         super().__init__(configuration, identifier)
 
-    def open(self, configuration: str, create: bool = False) -> Optional[int]:
+    def _configure(self, options: Mapping[str, Any]) -> None:
+        """Set the options given to the constructor or in the :meth:`open` configuration."""
+        for name, value in options.items():
+            if name in ("read_batch_size", "write_batch_size") and value <= 0:
+                raise ValueError(f"The {name.replace('_', ' ')} must be positive, {value} given")
+            if name == "query_workers" and value is not None and value <= 0:
+                raise ValueError(f"The number of query workers must be positive, {value} given")
+            if name == "term_cache_size":
+                self._term_cache = TermCache(value) if value else None
+            elif name == "query_cache_size":
+                self._query_cache = LruCache(value) if value else None
+            elif name == "autocommit":
+                self._autocommit = value
+                self.transaction_aware = not value
+            elif name in ("read_batch_size", "write_batch_size", "query_workers"):
+                setattr(self, f"_{name}", value)
+            else:
+                raise ValueError(f"Unknown OxigraphStore option: {name}")
+
+    def open(self, configuration: Union[str, Mapping[str, Any]], create: bool = False) -> Optional[int]:
+        """Open the store persisted in a directory.
+
+        The configuration is either the directory path, optionally followed by URL query options like
+        ``"path?mode=read_only&term_cache_size=10000"``, or a dict with the ``path`` and the options.
+        ``mode`` is ``read_write`` (default), ``read_only`` or ``bulk`` to load files and add batches of quads
+        with the faster but non-transactional Oxigraph bulk loader.
+        The other options are the ones of the constructor: ``term_cache_size``, ``query_cache_size``,
+        ``read_batch_size``, ``write_batch_size``, ``autocommit`` and ``query_workers``.
+        """
+        configuration, options = _parse_configuration(configuration)
+        mode = options.pop("mode", "read_write")
+        if mode not in _OPEN_MODES:
+            raise ValueError(f"The mode must be one of {', '.join(_OPEN_MODES)}, {mode} given")
         path = Path(configuration)
         if self._store is not None:
             raise ValueError("The open function should be called before any RDF operation")
         if create and path.exists():
             raise ValueError(f"The directory {configuration} already exist")
-        self._store = ox.Store(configuration)
+        if create and mode == "read_only":
+            raise ValueError("A read-only store can't be created")
+        self._configure(options)
+        self._read_only = mode == "read_only"
+        self._bulk_writes = mode == "bulk"
+        metadata = load_metadata(path)
+        triple_counts = metadata.pop("triple_counts", None)
+        # The counts are only reused if the store files did not change since they were written
+        if triple_counts is not None and triple_counts.get("fingerprint") == store_fingerprint(path):
+            self._triple_counts = {
+                (None if graph_name is None else decode_graph_name(graph_name)): count
+                for graph_name, count in triple_counts["graphs"]
+            }
+        self._store = ox.Store.read_only(configuration) if self._read_only else ox.Store(configuration)
+        self._path = path
+        if triple_counts is not None and not self._read_only:
+            # The counts are only valid until the next write, we remove them until the store is properly closed
+            save_metadata(path, metadata)
+        namespaces = metadata.get("namespaces")
+        if namespaces:
+            # The persisted bindings win over the ones rdflib set by default before the store is opened
+            self._bind_all((prefix, URIRef(namespace)) for prefix, namespace in namespaces)
+            with self._bindings_lock:
+                # Only the bindings set before opening that are not persisted yet are left to write
+                self._unsaved_bindings = len(self._namespace_for_prefix) - len(namespaces)
         return VALID_STORE
 
-    def close(self, commit_pending_transaction: bool = False) -> None:  # noqa: ARG002
+    def close(self, commit_pending_transaction: bool = False) -> None:
+        if commit_pending_transaction:
+            self.commit()
+        else:
+            self.rollback()
+        if self._query_executor is not None:
+            self._query_executor.shutdown()
+            self._query_executor = None
+        triple_counts = self._triple_counts
+        self._triple_counts = {}
         del self._store
+        # The store files are fingerprinted once Oxigraph closed them
+        self._save_metadata(triple_counts)
 
-    def destroy(self, configuration: str) -> None:
-        shutil.rmtree(configuration)
+    def _save_metadata(
+        self, triple_counts: Optional[Dict[Optional[Union[ox.NamedNode, ox.BlankNode, ox.DefaultGraph]], int]] = None
+    ) -> None:
+        """Write the namespace bindings and the given triple counts to the on-disk store metadata.
+
+        The triple counts must only be given once the Oxigraph store is closed.
+        """
+        if self._path is None or self._read_only:
+            self._unsaved_bindings = 0
+            return
+        if not triple_counts and not self._unsaved_bindings:
+            return
+        metadata = load_metadata(self._path)
+        if triple_counts:
+            metadata["triple_counts"] = {
+                "fingerprint": store_fingerprint(self._path),
+                "graphs": [
+                    (None if graph_name is None else encode_graph_name(graph_name), count)
+                    for graph_name, count in triple_counts.items()
+                ],
+            }
+        if self._unsaved_bindings:
+            with self._bindings_lock:
+                metadata["namespaces"] = [[prefix, str(namespace)] for prefix, namespace in self.namespaces()]
+                self._unsaved_bindings = 0
+        save_metadata(self._path, metadata)
+
+    def destroy(self, configuration: Union[str, Mapping[str, Any]]) -> None:
+        shutil.rmtree(_parse_configuration(configuration)[0])
 
     def gc(self) -> None:
         pass
 
+    def term_cache_info(self) -> Optional[CacheInfo]:
+        """Statistics of the rdflib/Oxigraph term conversion cache or ``None`` if the cache is disabled."""
+        return None if self._term_cache is None else self._term_cache.cache_info()
+
+    def query_cache_info(self) -> Optional[CacheInfo]:
+        """Statistics of the cache of the query and update prefixes or ``None`` if the cache is disabled."""
+        return None if self._query_cache is None else self._query_cache.cache_info()
+
+    @property
+    def _pending_changes(self) -> Optional[_PendingChanges]:
+        """The changes of the current transaction, creating it if the store is not in autocommit mode."""
+        if self._pending is None and not self._autocommit:
+            self._pending = _PendingChanges()
+        return self._pending
+
     @property
     def _inner(self) -> ox.Store:
         if self._store is None:
@@ -81,96 +415,483 @@ class OxigraphStore(Store):
     ) -> None:
         if quoted:
             raise ValueError("Oxigraph stores are not formula aware")
-        self._inner.add(to_ox(triple, context))
+        quad = to_ox(triple, context, self._term_cache)
+        pending = self._pending_changes
+        if pending is None:
+            self._insert_quad(quad)
+        else:
+            pending.add([quad])
         super().add(triple, context, quoted)
 
     def addN(self, quads: Iterable[_Quad]) -> None:  # noqa: N802
-        self._inner.extend([to_ox(q) for q in quads])
-        for quad in quads:
-            (s, p, o, g) = quad
-            super().add((s, p, o), g)
+        # We stream the quads by batches to keep the memory consumption bounded
+        quads = iter(quads)
+        while True:
+            batch = list(islice(quads, self._write_batch_size))
+            if not batch:
+                return
+            self._extend([to_ox(q, cache=self._term_cache) for q in batch])
+            for s, p, o, g in batch:
+                super().add((s, p, o), g)
 
     def remove(
         self,
         triple: _TriplePattern,
         context: Optional[Graph] = None,
     ) -> None:
-        for q in self._inner.quads_for_pattern(*to_ox_quad_pattern(triple, context)):
-            self._inner.remove(q)
+        self._remove(triple, context, count_removed=False)
         super().remove(triple, context)
 
+    def bulk_remove(self, triple: _TriplePattern, context: Optional[Graph] = None) -> int:
+        """Remove all the quads matching the pattern, if possible in a single atomic write.
+
+        Returns the number of removed quads.
+        They are counted just before the removal and not in the same transaction,
+        so the number might be wrong if someone else writes to the underlying pyoxigraph store at the same time.
+        """
+        return cast("int", self._remove(triple, context, count_removed=True))
+
+    def _remove(self, triple: _TriplePattern, context: Optional[Graph], count_removed: bool) -> Optional[int]:
+        pattern = to_ox_quad_pattern(triple, context, self._term_cache)
+        pending = self._pending_changes
+        if pending is not None:
+            removed = list(pending.quads_for_pattern(self._inner, pattern))
+            pending.remove(removed)
+            return len(removed)
+        (s, p, o, g) = pattern
+        if s is None and p is None and o is None and g is not None:
+            count = None
+            if count_removed:
+                count = self._triple_counts.get(g)
+                if count is None:
+                    count = self._count_triples(g)
+            self._inner.clear_graph(g)
+            if self._track_triple_counts:
+                self._triple_counts[g] = 0
+            self._triple_counts.pop(None, None)
+            return count
+        if (s is not None and p is not None and o is not None) or any(isinstance(t, ox.BlankNode) for t in pattern):
+            # SPARQL can't refer to a given blank node, we remove the quads one by one
+            return self._delete(list(self._inner.quads_for_pattern(*pattern)))
+        return self._delete_pattern(s, p, o, g, count_removed)
+
+    def _delete_pattern(
+        self,
+        s: Optional[Union[ox.NamedNode, ox.BlankNode]],
+        p: Optional[ox.NamedNode],
+        o: Optional[Union[ox.NamedNode, ox.BlankNode, ox.Literal]],
+        g: Optional[Union[ox.NamedNode, ox.BlankNode, ox.DefaultGraph]],
+        count_removed: bool,
+    ) -> Optional[int]:
+        """Remove the quads matching a pattern without blank nodes using a single DELETE WHERE SPARQL update."""
+        terms = [f"?{name}" if term is None else str(term) for name, term in (("s", s), ("p", p), ("o", o))]
+        triple_pattern = " ".join(terms)
+        if g is None:
+            update = f"DELETE WHERE {{ {triple_pattern} }} ; DELETE WHERE {{ GRAPH ?g {{ {triple_pattern} }} }}"
+        elif isinstance(g, ox.DefaultGraph):
+            update = f"DELETE WHERE {{ {triple_pattern} }}"
+        else:
+            update = f"DELETE WHERE {{ GRAPH {g} {{ {triple_pattern} }} }}"
+        if not count_removed:
+            if g is None:
+                self._triple_counts.clear()
+            else:
+                self._triple_counts.pop(g, None)
+                self._triple_counts.pop(None, None)
+            self._inner.update(update)
+            return None
+        removed, decrements = self._count_pattern_removal(terms, g)
+        if removed:
+            self._inner.update(update)
+        counts = self._triple_counts
+        if g is not None:
+            counts.pop(None, None)
+        for graph_name, count in decrements.items():
+            if graph_name in counts:
+                counts[graph_name] -= count
+        return removed
+
+    def _count_pattern_removal(
+        self, terms: List[str], g: Optional[Union[ox.NamedNode, ox.BlankNode, ox.DefaultGraph]]
+    ) -> Tuple[int, Dict[Optional[Union[ox.NamedNode, ox.BlankNode, ox.DefaultGraph]], int]]:
+        """Count the quads matching the pattern and the triples each cached count loses when they are removed."""
+        triple_pattern = " ".join(terms)
+        if g is not None:
+            removed = self._count(f"SELECT (COUNT(*) AS ?c) WHERE {{ {triple_pattern} }}", default_graph=g)
+            return removed, {g: removed}
+        decrements: Dict[Optional[Union[ox.NamedNode, ox.BlankNode, ox.DefaultGraph]], int] = {}
+        if None in self._triple_counts:
+            decrements[None] = self._count(
+                f"SELECT (COUNT(DISTINCT TRIPLE({', '.join(terms)})) AS ?c) WHERE {{ {triple_pattern} }}",
+                use_default_graph_as_union=True,
+            )
+        removed = 0
+        for solution in self._inner.query(
+            f"SELECT ?g (COUNT(*) AS ?c) "
+            f"WHERE {{ {{ {triple_pattern} }} UNION {{ GRAPH ?g {{ {triple_pattern} }} }} }} GROUP BY ?g"
+        ):
+            count = int(solution["c"].value)
+            decrements[solution["g"] or ox.DefaultGraph()] = count
+            removed += count
+        return removed, decrements
+
+    def _insert_quad(self, quad: ox.Quad) -> None:
+        counts = self._triple_counts
+        if not counts or quad in self._inner:
+            self._inner.add(quad)
+            return
+        new_triple = None in counts and not self._contains_triple(quad.triple)
+        self._inner.add(quad)
+        # The counts are only updated once the write succeeded
+        if quad.graph_name in counts:
+            counts[quad.graph_name] += 1
+        if new_triple:
+            counts[None] += 1
+
+    def _extend(self, quads: List[ox.Quad], *, bulk: bool = False) -> None:
+        """Add the quads, staging them if a transaction is open. With ``bulk``, they are not added atomically."""
+        pending = self._pending_changes
+        if pending is None:
+            self._insert(quads, bulk=bulk)
+        else:
+            pending.add(quads)
+
+    def _insert(self, quads: List[ox.Quad], *, bulk: bool = False) -> None:
+        counts = self._triple_counts
+        if counts:
+            # Checking each quad would cost two lookups per quad, we only invalidate the counts
+            counts.pop(None, None)
+            for graph_name in {quad.graph_name for quad in quads}:
+                counts.pop(graph_name, None)
+        if bulk or self._bulk_writes:
+            self._inner.bulk_extend(quads)
+        else:
+            self._inner.extend(quads)
+
+    def _delete(self, quads: Iterable[ox.Quad]) -> int:
+        counts = self._triple_counts
+        removed = 0
+        for quad in quads:
+            self._inner.remove(quad)
+            removed += 1
+            if counts:
+                if quad.graph_name in counts:
+                    counts[quad.graph_name] -= 1
+                if None in counts and not self._contains_triple(quad.triple):
+                    counts[None] -= 1
+        return removed
+
+    def _contains_triple(self, triple: ox.Triple) -> bool:
+        return next(self._inner.quads_for_pattern(triple.subject, triple.predicate, triple.object), None) is not None
+
+    def _load(self, *, bulk: bool = False, **kwargs: object) -> None:
+        pending = self._pending_changes
+        if pending is not None:
+            # The staged additions are kept in an in-memory store, bulk loading it would not bring anything
+            additions = ox.Store()
+            additions.load(**kwargs)
+            pending.add(list(additions))
+            return
+        self._triple_counts.clear()
+        if bulk or self._bulk_writes:
+            self._inner.bulk_load(**kwargs)
+        else:
+            self._inner.load(**kwargs)
+
+    def export_graphs(
+        self,
+        directory: Union[str, Path],
+        format: ox.RdfFormat = ox.RdfFormat.N_TRIPLES,  # noqa: A002
+        *,
+        workers: Optional[int] = None,
+    ) -> Path:
+        """Write each graph of the store to its own file in ``directory`` and return the path of the manifest.
+
+        The graphs are serialized by Oxigraph in a pool of ``workers`` threads, the number of CPUs by default.
+        The JSON manifest lists for each graph its name, in N-Triples syntax or ``DEFAULT`` for the default graph,
+        and the name of its file.
+        Each graph is read in its own snapshot of the store and the uncommitted changes are not exported.
+        """
+        if workers is not None and workers <= 0:
+            raise ValueError(f"The number of workers must be positive, {workers} given")
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        graph_names: List[Union[ox.NamedNode, ox.BlankNode, ox.DefaultGraph]] = [ox.DefaultGraph()]
+        graph_names.extend(self._inner.named_graphs())
+        files = [f"graph-{i}.{format.file_extension}" for i in range(len(graph_names))]
+
+        def export(graph_name: Union[ox.NamedNode, ox.BlankNode, ox.DefaultGraph], file_name: str) -> None:
+            # Oxigraph writes the file without holding the GIL
+            self._inner.dump(output=str(directory / file_name), format=format, from_graph=graph_name)
+
+        with ThreadPoolExecutor(workers or os.cpu_count()) as executor:
+            for _ in executor.map(export, graph_names, files):
+                pass  # Raises the first error
+        manifest = {
+            "format": format.media_type,
+            "graphs": [
+                {"graph": encode_graph_name(graph_name), "file": file_name}
+                for graph_name, file_name in zip(graph_names, files)
+            ],
+        }
+        path = directory / EXPORT_MANIFEST_FILE_NAME
+        with path.open("w", encoding="utf-8") as fp:
+            json.dump(manifest, fp, indent=2)
+        return path
+
+    def import_files(
+        self,
+        files: Iterable[Tuple[Union[str, Path], ox.RdfFormat, Optional[Union[Graph, Identifier]]]],
+        *,
+        workers: Optional[int] = None,
+        bulk: bool = True,
+    ) -> Dict[Path, BaseException]:
+        """Load the ``(path, format, graph)`` files in parallel and return the errors of the files that failed.
+
+        Each file is loaded into its graph, the default graph if it is ``None``, by Oxigraph without holding the GIL
+        in a pool of ``workers`` threads, the number of CPUs by default.
+        With ``bulk``, the Oxigraph bulk loader is used: it is much faster but a failing file might be partially loaded.
+        The errors do not stop the loading of the other files.
+        """
+        if workers is not None and workers <= 0:
+            raise ValueError(f"The number of workers must be positive, {workers} given")
+        if self._pending_changes is not None:
+            workers = 1  # The staged changes are not meant to be written concurrently
+
+        def load(file: Tuple[Union[str, Path], ox.RdfFormat, Optional[Union[Graph, Identifier]]]) -> None:
+            path, format, graph = file  # noqa: A001
+            self._load(
+                path=str(path),
+                format=format,
+                base_iri=Path(path).absolute().as_uri(),
+                to_graph=ox.DefaultGraph() if graph is None else to_ox(graph),
+                bulk=bulk,
+            )
+
+        errors: Dict[Path, BaseException] = {}
+        with ThreadPoolExecutor(workers or os.cpu_count()) as executor:
+            futures = {executor.submit(load, file): Path(file[0]) for file in files}
+            for future, path in futures.items():
+                error = future.exception()
+                if error is not None:
+                    errors[path] = error
+        return errors
+
     def triples(
         self,
         triple_pattern: _TriplePattern,
         context: Optional[Graph] = None,
     ) -> Iterator[Tuple[_Triple, Iterator[Optional[Graph]]]]:
         try:
-            return (
-                (
-                    (from_ox(q.subject), from_ox(q.predicate), from_ox(q.object)),
-                    iter(((from_ox_graph_name(q.graph_name, self)),)),
-                )
-                for q in self._inner.quads_for_pattern(*to_ox_quad_pattern(triple_pattern, context))
-            )
+            pattern = to_ox_quad_pattern(triple_pattern, context, self._term_cache)
+            quads = self._inner.quads_for_pattern(*pattern)
         except (TypeError, ValueError):
             return iter(())  # We just don't return anything
+        if self._pending is not None:
+            quads = self._pending.quads_for_pattern(self._inner, pattern)
+        return self._triples_from_quads(quads)
+
+    def _triples_from_quads(self, quads: Iterator[ox.Quad]) -> Iterator[Tuple[_Triple, Iterator[Optional[Graph]]]]:
+        # We convert the quads by batches of growing size to keep a low latency on the first results
+        batch_size = min(_FIRST_READ_BATCH_SIZE, self._read_batch_size)
+        while True:
+            batch = from_ox_quads(islice(quads, batch_size), self, self._term_cache)
+            for triple, graph in batch:
+                yield triple, iter((graph,))
+            if len(batch) < batch_size:
+                return
+            batch_size = min(2 * batch_size, self._read_batch_size)
 
     def __len__(self, context: Optional[Graph] = None) -> int:
-        return int(
-            next(
-                self._inner.query(
-                    "SELECT (COUNT(DISTINCT TRIPLE(?s, ?p, ?o)) AS ?c) WHERE { ?s ?p ?o }",
-                    **(
-                        {"use_default_graph_as_union": True} if context is None else {"default_graph": to_ox(context)}  # type: ignore[dict-item]
-                    ),
-                ),
-            )[0].value,
-        )
+        graph_name = None if context is None else to_ox(context, cache=self._term_cache)
+        count = self._committed_len(graph_name)
+        if self._pending is not None:
+            count += self._pending.triple_count_delta(self._inner, graph_name)
+        return count
+
+    def _committed_len(self, graph_name: Optional[Union[ox.NamedNode, ox.BlankNode, ox.DefaultGraph]]) -> int:
+        count = self._triple_counts.get(graph_name)
+        if count is None:
+            count = self._count_triples(graph_name)
+            if self._track_triple_counts:
+                self._triple_counts[graph_name] = count
+        return count
+
+    def _count_triples(self, graph_name: Optional[Union[ox.NamedNode, ox.BlankNode, ox.DefaultGraph]]) -> int:
+        only_graph = self._only_graph()
+        if only_graph is not None and (graph_name is None or graph_name == only_graph):
+            # All the quads are in the same graph so they are all distinct triples
+            return len(self._inner)
+        if graph_name is None:
+            return self._count(
+                "SELECT (COUNT(DISTINCT TRIPLE(?s, ?p, ?o)) AS ?c) WHERE { ?s ?p ?o }", use_default_graph_as_union=True
+            )
+        return self._count("SELECT (COUNT(*) AS ?c) WHERE { ?s ?p ?o }", default_graph=graph_name)
+
+    def _only_graph(self) -> Optional[Union[ox.NamedNode, ox.BlankNode, ox.DefaultGraph]]:
+        """The graph containing all the quads if there is a single graph, ``None`` otherwise."""
+        named_graphs = list(islice(self._inner.named_graphs(), 2))
+        if not named_graphs:
+            return ox.DefaultGraph()
+        if (
+            len(named_graphs) == 1
+            and next(self._inner.quads_for_pattern(None, None, None, ox.DefaultGraph()), None) is None
+        ):
+            return named_graphs[0]
+        return None
+
+    def _count(self, query: str, **kwargs: Any) -> int:  # noqa: ANN401
+        return int(next(self._inner.query(query, **kwargs))[0].value)
 
     def contexts(self, triple: Optional[_Triple] = None) -> Generator[Graph, None, None]:
         if triple is None:
-            return (from_ox_graph_name(g, self) for g in self._inner.named_graphs())
-        return (
-            from_ox_graph_name(q.graph_name, self) for q in self._inner.quads_for_pattern(*to_ox_quad_pattern(triple))
+            graph_names = (
+                self._inner.named_graphs() if self._pending is None else self._pending.named_graphs(self._inner)
+            )
+            return (from_ox_graph_name(g, self) for g in graph_names)
+        pattern = to_ox_quad_pattern(triple, cache=self._term_cache)
+        quads = (
+            self._inner.quads_for_pattern(*pattern)
+            if self._pending is None
+            else self._pending.quads_for_pattern(self._inner, pattern)
         )
+        return (from_ox_graph_name(q.graph_name, self) for q in quads)
 
     def query(
         self,
-        query: Union[Query, str],
+        query: Union["Query", str],
         initNs: Mapping[str, Any],  # noqa: N803
         initBindings: Mapping[str, Identifier],  # noqa: N803
         queryGraph: str,  # noqa: N803
+        *,
+        construct_result: str = "graph",
         **kwargs: object,
     ) -> "Result":
-        if isinstance(query, Query):
-            raise NotImplementedError("The already parsed Queries are not supported by Oxigraph store")
+        """Evaluate a SPARQL query with Oxigraph.
+
+        ``construct_result`` sets how CONSTRUCT and DESCRIBE results are returned:
+        ``"graph"`` fills an in-memory rdflib :class:`~rdflib.Graph`,
+        ``"store"`` fills a :class:`~rdflib.Graph` backed by a temporary :class:`OxigraphStore`
+        without converting the triples to rdflib terms,
+        and ``"iterator"`` lazily converts the triples while the result is iterated, only once.
+        """
+        base_iri = None
+        if not isinstance(query, str):
+            query, initNs, base_iri = _original_text(query, initNs)  # noqa: N806
+        if self._pending is not None:
+            # rdflib falls back to its own SPARQL engine that sees the pending changes through triples()
+            raise NotImplementedError("Oxigraph can't evaluate SPARQL queries on uncommitted changes")
         for kwarg in kwargs:
             raise NotImplementedError(f"The parameter {kwarg} is not supported by Oxigraph store")
-        result = self._inner.query(
-            query,
-            use_default_graph_as_union=queryGraph == "__UNION__",
-            default_graph=(to_ox(queryGraph) if isinstance(queryGraph, Node) else None),
-            prefixes=dict(self._namespace_for_prefix, **initNs),
-            substitutions={ox.Variable(k): to_ox(v) for k, v in initBindings.items()},
-        )
+        if construct_result not in _CONSTRUCT_RESULTS:
+            raise ValueError(
+                f"construct_result must be one of {', '.join(_CONSTRUCT_RESULTS)}, {construct_result} given"
+            )
+        result = self._evaluate(query, initNs, initBindings, queryGraph, base_iri)
         if isinstance(result, ox.QueryBoolean):
             out = Result("ASK")
             out.askAnswer = bool(result)
         elif isinstance(result, ox.QuerySolutions):
             out = Result("SELECT")
             out.vars = [Variable(v.value) for v in result.variables]
-            out.bindings = ({v: from_ox(val) for v, val in zip(out.vars, solution)} for solution in result)
+            out.bindings = (
+                {v: from_ox(val, self._term_cache) for v, val in zip(out.vars, solution)} for solution in result
+            )
         elif isinstance(result, ox.QueryTriples):
             out = Result("CONSTRUCT")
-            out.graph = Graph()
-            out.graph += (from_ox(t) for t in result)
+            out.graph = self._construct_graph(result, construct_result)
         else:
             raise ValueError(f"Unexpected query result: {result}")
         return out
 
+    def query_columns(
+        self,
+        query: str,
+        initNs: Optional[Mapping[str, Any]] = None,  # noqa: N803
+        initBindings: Optional[Mapping[str, Identifier]] = None,  # noqa: N803
+        queryGraph: Optional[Union[str, Node]] = None,  # noqa: N803
+        *,
+        batch_size: int = DEFAULT_COLUMN_BATCH_SIZE,
+    ) -> ColumnarResult:
+        """Evaluate a SPARQL SELECT query and return its solutions with one column per variable.
+
+        The columns are filled by batches of ``batch_size`` solutions without building rdflib terms.
+        ``queryGraph`` has the same meaning as in :meth:`query`, the default graph is used if it is ``None``.
+        """
+        if self._pending is not None:
+            raise NotImplementedError("Oxigraph can't evaluate SPARQL queries on uncommitted changes")
+        if batch_size <= 0:
+            raise ValueError(f"The batch size must be positive, {batch_size} given")
+        result = self._evaluate(query, initNs or {}, initBindings or {}, queryGraph, None)
+        if not isinstance(result, ox.QuerySolutions):
+            raise ValueError("Only SELECT queries results can be returned as columns")
+        return columns_from_solutions(result, batch_size)
+
+    def submit_query(
+        self,
+        query: Union["Query", str],
+        initNs: Optional[Mapping[str, Any]] = None,  # noqa: N803
+        initBindings: Optional[Mapping[str, Identifier]] = None,  # noqa: N803
+        queryGraph: Union[str, Node] = DATASET_DEFAULT_GRAPH_ID,  # noqa: N803
+        **kwargs: Any,  # noqa: ANN401
+    ) -> "Future[Result]":
+        """Evaluate a SPARQL query like :meth:`query` in the pool of ``query_workers`` threads of the store.
+
+        Oxigraph evaluates the queries without holding the GIL, so they run in parallel.
+        The SELECT solutions are all converted to rdflib terms in the pool before the future is resolved.
+        The ``"iterator"`` ``construct_result`` is not supported: pyoxigraph results can't leave their thread.
+        """
+        if kwargs.get("construct_result") == "iterator":
+            raise ValueError("The 'iterator' CONSTRUCT results can't be used outside of the worker threads")
+        if self._query_executor is None:
+            with self._query_executor_lock:
+                if self._query_executor is None:
+                    self._query_executor = ThreadPoolExecutor(self._query_workers or os.cpu_count())
+        return self._query_executor.submit(
+            self._query_and_fetch, query, initNs or {}, initBindings or {}, queryGraph, **kwargs
+        )
+
+    def _query_and_fetch(self, *args: Any, **kwargs: Any) -> Result:  # noqa: ANN401
+        result = self.query(*args, **kwargs)
+        if result.type == "SELECT":
+            # Fetches all the solutions
+            result.bindings  # noqa: B018
+        return result
+
+    def _evaluate(
+        self,
+        query: str,
+        initNs: Mapping[str, Any],  # noqa: N803
+        initBindings: Mapping[str, Identifier],  # noqa: N803
+        queryGraph: Optional[Union[str, Node]],  # noqa: N803
+        base_iri: Optional[str],
+    ) -> Union[ox.QuerySolutions, ox.QueryBoolean, ox.QueryTriples]:
+        return self._inner.query(
+            query,
+            base_iri=base_iri,
+            use_default_graph_as_union=queryGraph == "__UNION__",
+            default_graph=(to_ox(queryGraph) if isinstance(queryGraph, Node) else None),
+            prefixes=self._prefixes(query, initNs),
+            substitutions={ox.Variable(k): to_ox(v, cache=self._term_cache) for k, v in initBindings.items()},
+        )
+
+    def _construct_graph(self, triples: ox.QueryTriples, construct_result: str) -> Graph:
+        if construct_result == "store":
+            store = OxigraphStore()
+            # The store is new and private, no need for the transactional guarantees of extend
+            store._inner.bulk_extend(ox.Quad(t.subject, t.predicate, t.object) for t in triples)
+            return Graph(store=store, identifier=DATASET_DEFAULT_GRAPH_ID)
+        converted = (from_ox(t, self._term_cache) for t in triples)
+        if construct_result == "iterator":
+            # Result only iterates on its graph, a generator is enough if the result is not used as a Graph
+            return cast("Graph", converted)
+        graph = Graph()
+        graph += converted
+        return graph
+
     def update(
         self,
-        update: Union[Update, str],
+        update: Union["Update", str],
         initNs: Mapping[str, Any],  # noqa: N803
         initBindings: Mapping[str, Identifier],  # noqa: N803
         queryGraph: str,  # noqa: N803
@@ -180,47 +901,107 @@ class OxigraphStore(Store):
             raise NotImplementedError("initBindings are not supported by Oxigraph store")
         if queryGraph != DATASET_DEFAULT_GRAPH_ID:
             raise NotImplementedError(f"Only {DATASET_DEFAULT_GRAPH_ID} is supported by native Oxigraph store")
-        if isinstance(update, Update):
-            raise NotImplementedError("The already parsed Updates are not supported by Oxigraph store")
+        base_iri = None
+        if not isinstance(update, str):
+            update, initNs, base_iri = _original_text(update, initNs)  # noqa: N806
+        if self._pending is not None:
+            raise NotImplementedError("Oxigraph can't evaluate SPARQL updates on uncommitted changes")
         for kwarg in kwargs:
             raise NotImplementedError(f"The parameter {kwarg} is not supported by Oxigraph store")
-        self._inner.update(update, prefixes=dict(self._namespace_for_prefix, **initNs))
+        self._triple_counts.clear()
+        self._inner.update(update, base_iri=base_iri, prefixes=self._prefixes(update, initNs))
+
+    def _prefixes(self, text: str, initNs: Mapping[str, Any]) -> Dict[str, str]:  # noqa: N803
+        """The prefixes to give to Oxigraph to parse the query or update ``text``."""
+        if self._query_cache is None:
+            return dict(self._namespace_for_prefix, **initNs)
+        # The version is read before the bindings: if they change in the meantime, the entry will never be used
+        return self._query_cache.get((text, frozenset(initNs.items()), self._bindings_version), self._compute_prefixes)
+
+    def _compute_prefixes(self, key: Tuple[str, FrozenSet[Tuple[str, Any]], int]) -> Dict[str, str]:
+        text, init_ns, _ = key
+        # Oxigraph converts all the given prefixes on each call, we only keep the ones that might be used
+        return {
+            prefix: str(namespace)
+            for prefix, namespace in dict(self._namespace_for_prefix, **dict(init_ns)).items()
+            if f"{prefix}:" in text
+        }
 
     def commit(self) -> None:
-        # TODO: implement
-        pass
+        """Write the changes staged since the last commit or rollback.
+
+        This is a no-op in autocommit mode where each write is already committed.
+        The changes are written in a single atomic write, except if they both remove some quads or graphs
+        and contain blank nodes because SPARQL updates can't refer to existing blank nodes.
+        """
+        if self._pending is None:
+            return
+        self._triple_counts.clear()
+        self._pending.apply(self._inner)
+        self._pending = None
 
     def rollback(self) -> None:
-        # TODO: implement
-        pass
+        """Discard the changes staged since the last commit or rollback.
+
+        This is a no-op in autocommit mode where each write is already committed.
+        """
+        self._pending = None
 
     def add_graph(self, graph: Graph) -> None:
-        self._inner.add_graph(to_ox(graph))
+        graph_name = to_ox(graph)
+        pending = self._pending_changes
+        if pending is not None:
+            pending.removed_graphs.discard(graph_name)
+            pending.additions.add_graph(graph_name)
+            return
+        self._inner.add_graph(graph_name)
 
     def remove_graph(self, graph: Graph) -> None:
-        self._inner.remove_graph(to_ox(graph))
+        graph_name = to_ox(graph)
+        pending = self._pending_changes
+        if pending is not None:
+            pending.remove(list(pending.quads_for_pattern(self._inner, (None, None, None, graph_name))))
+            pending.additions.remove_graph(graph_name)
+            pending.removed_graphs.add(graph_name)
+            return
+        self._triple_counts.pop(graph_name, None)
+        self._triple_counts.pop(None, None)
+        self._inner.remove_graph(graph_name)
 
     def bind(self, prefix: str, namespace: URIRef, override: bool = True) -> None:
-        if not override and (prefix in self._namespace_for_prefix or namespace in self._prefix_for_namespace):
-            return  # nothing to do
-        self._delete_from_prefix(prefix)
-        self._delete_from_namespace(namespace)
-        self._namespace_for_prefix[prefix] = namespace
-        self._prefix_for_namespace[namespace] = prefix
-
-    def _delete_from_prefix(self, prefix: str) -> None:
-        if prefix not in self._namespace_for_prefix:
-            return
-        namespace = self._namespace_for_prefix[prefix]
-        del self._namespace_for_prefix[prefix]
-        self._delete_from_namespace(namespace)
+        self._bind_all(((prefix, namespace),), override)
 
-    def _delete_from_namespace(self, namespace: str) -> None:
-        if namespace not in self._prefix_for_namespace:
-            return
-        prefix = self._prefix_for_namespace[namespace]
-        del self._prefix_for_namespace[namespace]
-        self._delete_from_prefix(prefix)
+    def _bind_all(self, bindings: Iterable[Tuple[str, URIRef]], override: bool = True) -> None:
+        """Apply a sequence of :meth:`bind` calls, building the new bindings only once."""
+        with self._bindings_lock:
+            namespace_for_prefix = dict(self._namespace_for_prefix)
+            prefix_for_namespace = dict(self._prefix_for_namespace)
+            changes = 0
+            for prefix, namespace in bindings:
+                if not override and (prefix in namespace_for_prefix or namespace in prefix_for_namespace):
+                    continue  # nothing to do
+                if namespace_for_prefix.get(prefix) == namespace:
+                    continue  # already bound
+                old_prefix = prefix_for_namespace.pop(namespace, None)
+                if old_prefix is not None:
+                    del namespace_for_prefix[old_prefix]
+                old_namespace = namespace_for_prefix.pop(prefix, None)
+                if old_namespace is not None:
+                    del prefix_for_namespace[old_namespace]
+                namespace_for_prefix[prefix] = namespace
+                prefix_for_namespace[namespace] = prefix
+                changes += 1
+            if not changes:
+                return
+            self._namespace_for_prefix = namespace_for_prefix
+            self._prefix_for_namespace = prefix_for_namespace
+            self._bindings_version += 1
+            self._unsaved_bindings += changes
+            save = self._unsaved_bindings >= _BINDINGS_SAVE_BATCH_SIZE
+        if self._query_cache is not None:
+            self._query_cache.clear()
+        if save:
+            self._save_metadata()
 
     def prefix(self, namespace: URIRef) -> Optional[str]:
         return self._prefix_for_namespace.get(namespace)
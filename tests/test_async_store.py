@@ -0,0 +1,115 @@
+import asyncio
+import gc
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from unittest.mock import patch
+
+from pyoxigraph import RdfFormat
+from rdflib import Dataset, Literal, Namespace, Variable
+from rdflib.graph import DATASET_DEFAULT_GRAPH_ID
+
+from oxrdflib import AsyncOxigraphStore, OxigraphStore
+
+EX = Namespace("http://example.com/")
+
+
+class AsyncStoreTestCase(unittest.IsolatedAsyncioTestCase):
+    async def test_query_update(self) -> None:
+        async with AsyncOxigraphStore(max_workers=2) as store:
+            await store.update("INSERT DATA { ex:s ex:p 1, 2, 3 }", {"ex": EX})
+            result = await store.query("ASK { ex:s ex:p 1 }", {"ex": EX})
+            self.assertTrue(result.askAnswer)
+            result = await store.query("SELECT ?o WHERE { ?s ?p ?o } ORDER BY ?o")
+            self.assertEqual([row.o for row in result], [Literal(1), Literal(2), Literal(3)])
+            rows = [
+                row.o
+                async for row in store.select(
+                    "SELECT ?s ?o WHERE { ?s ?p ?o } ORDER BY ?o", initBindings={"s": EX.s}, batch_size=2
+                )
+            ]
+            self.assertEqual(rows, [Literal(1), Literal(2), Literal(3)])
+            with self.assertRaises(ValueError):
+                async for _ in store.select("ASK { ?s ?p ?o }"):
+                    pass
+            result = await store.query("CONSTRUCT WHERE { ?s ?p ?o }", construct_result="store")
+            self.assertEqual(len(result.graph), 3)
+            with self.assertRaises(ValueError):
+                await store.query("CONSTRUCT WHERE { ?s ?p ?o }", construct_result="iterator")
+
+    async def test_iterators_thread(self) -> None:
+        # pyoxigraph iterators must stay in the thread that created them, whatever worker fetches the batches
+        async with AsyncOxigraphStore(max_workers=4) as store:
+            await store.update("INSERT DATA { " + " ".join(f"<{EX.s}> <{EX.p}> {i} ." for i in range(50)) + " }")
+            rows = [row async for row in store.select("SELECT ?o WHERE { ?s ?p ?o }", batch_size=1)]
+            self.assertEqual(len(rows), 50)
+            async for _ in store.triples((None, None, None), batch_size=1):
+                break  # The iterator is dropped in its thread too
+
+    async def test_select_break(self) -> None:
+        async with AsyncOxigraphStore(max_workers=2) as store:
+            await store.update("INSERT DATA { " + " ".join(f"<{EX.s}> <{EX.p}> {i} ." for i in range(50)) + " }")
+            with patch("sys.unraisablehook") as unraisablehook:
+                async for _ in store.select("SELECT ?o WHERE { ?s ?p ?o }", batch_size=10):
+                    break
+                gc.collect()
+                await asyncio.sleep(0.1)  # Lets the generator close and the worker drop the solutions
+                gc.collect()
+            unraisablehook.assert_not_called()
+
+    async def test_select_cancel(self) -> None:
+        async with AsyncOxigraphStore() as store:
+            await store.update("INSERT DATA { " + " ".join(f"<{EX.s}> <{EX.p}> {i} ." for i in range(50)) + " }")
+
+            async def consume() -> None:
+                # A slow query, Oxigraph evaluates it when the first solution is fetched
+                query = "SELECT (COUNT(*) AS ?c) WHERE { ?a ?b ?c . ?d ?e ?f . ?g ?h ?i . ?j ?k ?l }"
+                async for _ in store.select(query):
+                    pass
+
+            start = perf_counter()
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(consume(), 0.05)
+            # The cancellation does not wait for the running batch
+            self.assertLess(perf_counter() - start, 0.5)
+
+    async def test_triples(self) -> None:
+        store = OxigraphStore()
+        dataset = Dataset(store)
+        dataset.add((EX.s, EX.p, EX.o1))
+        dataset.add((EX.s, EX.p, EX.o2, EX.g))
+        async with AsyncOxigraphStore(store) as async_store:
+            triples = [t async for t in async_store.triples((EX.s, None, None), batch_size=1)]
+            self.assertEqual(sorted(triples), [(EX.s, EX.p, EX.o1), (EX.s, EX.p, EX.o2)])
+            triples = [t async for t in async_store.triples((None, None, None), dataset.get_context(EX.g))]
+            self.assertEqual(triples, [(EX.s, EX.p, EX.o2)])
+
+    async def test_load_dump(self) -> None:
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / "data.nt"
+            path.write_text(f"<{EX.s}> <{EX.p}> <{EX.o}> .\n")
+            async with AsyncOxigraphStore() as store:
+                await asyncio.gather(store.load(path, RdfFormat.N_TRIPLES, EX.g), store.load(path, RdfFormat.N_TRIPLES))
+                await store.dump(Path(directory) / "dump.nq", RdfFormat.N_QUADS)
+                await store.dump(Path(directory) / "dump.nt", RdfFormat.N_TRIPLES, DATASET_DEFAULT_GRAPH_ID)
+            dataset = Dataset(store="Oxigraph")
+            dataset.parse(Path(directory) / "dump.nq", format="ox-nquads")
+            self.assertEqual(
+                set(dataset.quads()), {(EX.s, EX.p, EX.o, EX.g), (EX.s, EX.p, EX.o, DATASET_DEFAULT_GRAPH_ID)}
+            )
+            self.assertEqual((Path(directory) / "dump.nt").read_text(), f"<{EX.s}> <{EX.p}> <{EX.o}> .\n")
+
+    async def test_max_workers(self) -> None:
+        with self.assertRaises(ValueError):
+            AsyncOxigraphStore(max_workers=0)
+        async with AsyncOxigraphStore(max_workers=1) as store:
+            # The operations wait for the single worker instead of failing
+            results = await asyncio.gather(
+                *(store.query("SELECT (?x AS ?y) WHERE { BIND(1 AS ?x) }") for _ in range(5))
+            )
+            self.assertEqual([[row[Variable("y")] for row in result] for result in results], [[Literal(1)]] * 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
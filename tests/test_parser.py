@@ -1,10 +1,25 @@
+import bz2
+import gzip
+import lzma
+import subprocess
+import sys
 import unittest
 from io import StringIO
 from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Callable, Iterable, List, Tuple
+from unittest.mock import patch
 
+import pyoxigraph
 import rdflib
 from rdflib import Dataset, Graph, URIRef
+from rdflib.exceptions import ParserError
 from rdflib.graph import DATASET_DEFAULT_GRAPH_ID
+from rdflib.plugins.stores.memory import Memory
+from rdflib.term import Node
+
+from oxrdflib import OxigraphStore
+from oxrdflib.parser import LoadProgress
 
 _TEST_DIR = Path(__file__).resolve().parent
 
@@ -79,6 +94,153 @@ class TestParser(unittest.TestCase):
                         )
                         self.assertEqual(set(dataset), {(s, p, o, g), (s, p, o, DATASET_DEFAULT_GRAPH_ID)})
 
+    def test_parse_parallel(self) -> None:
+        serialization = "".join(
+            f"_:b{i % 10} <http://example.com/vocab#p> <http://example.com/o{i}> <http://example.com/g> .\n"
+            f'<http://example.com/s> <http://example.com/vocab#p> "{i}" .\n'
+            for i in range(1000)
+        )
+        for store in ("default", "oxigraph"):
+            for transactional in (True, False):
+                with self.subTest(store=store, transactional=transactional), patch(
+                    "oxrdflib.parser._PARALLEL_CHUNK_SIZE", 1000
+                ):
+                    dataset = Dataset(store=store)
+                    dataset.parse(StringIO(serialization), format="ox-nquads", transactional=transactional, workers=3)
+                    self.assertEqual(len(dataset.get_context(g)), 1000)
+                    self.assertEqual(len(dataset.default_context), 1000)
+                    # The blank nodes are shared by the chunks
+                    self.assertEqual(len(set(dataset.get_context(g).subjects())), 10)
+                    if store == "default":
+                        continue  # The Oxigraph parsers keep the blank node labels with rdflib stores
+                    # but not with an other parsing
+                    dataset.parse(StringIO(serialization), format="ox-nquads", transactional=transactional, workers=3)
+                    self.assertEqual(len(set(dataset.get_context(g).subjects())), 20)
+
+    def test_parse_batches(self) -> None:
+        calls = []
+
+        class RecordingMemory(Memory):
+            def addN(self, quads: Iterable[Tuple[Node, Node, Node, Graph]]) -> None:  # noqa: N802
+                quads = list(quads)
+                calls.append(quads)
+                super().addN(quads)
+
+        serialization = "".join(
+            f"<http://example.com/s> <http://example.com/vocab#p> <http://example.com/o{i}> <http://example.com/g> .\n"
+            for i in range(5)
+        )
+        dataset = Dataset(store=RecordingMemory())
+        with patch("oxrdflib.parser._SINK_BATCH_SIZE", 2):
+            dataset.parse(StringIO(serialization), format="ox-nquads")
+        self.assertEqual([len(quads) for quads in calls], [2, 2, 1])
+        # A single graph object is used for each graph name
+        self.assertEqual(len({id(q[3]) for quads in calls for q in quads}), 1)
+        self.assertEqual(len(dataset.get_context(g)), 5)
+
+    def test_parse_bulk_load_threshold(self) -> None:
+        path = _TEST_DIR / "data.nt"
+        path.write_text("<http://example.com/s> <http://example.com/vocab#p> <http://example.com/o> .\n")
+        try:
+            for threshold, bulk in ((0, True), (1000, False)):
+                with self.subTest(threshold=threshold), patch.object(OxigraphStore, "_load") as load:
+                    Graph(store="oxigraph").parse(path, format="ox-nt", bulk_load_threshold=threshold)
+                    self.assertEqual(load.call_args.kwargs["bulk"], bulk)
+            with patch.object(OxigraphStore, "_load") as load:
+                Graph(store="oxigraph").parse(path, format="ox-nt", bulk_load_threshold=0, transactional=True)
+                self.assertFalse(load.call_args.kwargs["bulk"])
+        finally:
+            path.unlink()
+
+    def test_parse_progress(self) -> None:
+        serialization = "".join(
+            f"_:b <http://example.com/vocab#p> <http://example.com/o{i}> <http://example.com/g> .\n" for i in range(5)
+        )
+        for store in ("default", "oxigraph"):
+            for workers in (None, 2):
+                with self.subTest(store=store, workers=workers), patch("oxrdflib.parser._SINK_BATCH_SIZE", 2), patch(
+                    "oxrdflib.parser._PARALLEL_CHUNK_SIZE", 100
+                ):
+                    reports: List[LoadProgress] = []
+                    dataset = Dataset(store=store)
+                    dataset.parse(StringIO(serialization), format="ox-nquads", progress=reports.append, workers=workers)
+                    self.assertEqual(len(set(dataset.get_context(g).subjects())), 1)
+                    self.assertIsInstance(reports[-1], LoadProgress)
+                    self.assertEqual(reports[-1].quads, 5)
+                    self.assertEqual(reports[-1].bytes_read, len(serialization))
+                    self.assertEqual([r.quads for r in reports], sorted(r.quads for r in reports))
+                    self.assertGreaterEqual(reports[-1].quads_per_second, 0)
+
+    def test_parse_progress_transactional(self) -> None:
+        serialization = "".join(
+            f"<http://example.com/s> <http://example.com/vocab#p> <http://example.com/o{i}> .\n" for i in range(5)
+        )
+        for transactional, loaded in ((True, 0), (False, 4)):
+            with self.subTest(transactional=transactional), patch("oxrdflib.parser._SINK_BATCH_SIZE", 2):
+                reports: List[LoadProgress] = []
+                graph = Graph(store="oxigraph")
+                with self.assertRaises(SyntaxError):
+                    graph.parse(
+                        StringIO(serialization + "<http://example.com/s> <http://example.com/vocab#p> .\n"),
+                        format="ox-nt",
+                        progress=reports.append,
+                        transactional=transactional,
+                    )
+                self.assertEqual(len(graph), loaded)
+                self.assertEqual(reports[-1].quads, 4)
+
+    def test_parse_compressed(self) -> None:
+        serialization = b"<http://example.com/s> <http://example.com/vocab#p> <http://example.com/o> .\n"
+        compressors: List[Tuple[str, Callable[[bytes], bytes]]] = [
+            ("gz", gzip.compress),
+            ("bz2", bz2.compress),
+            ("xz", lzma.compress),
+        ]
+        try:
+            import zstandard
+
+            compressors.append(("zst", zstandard.ZstdCompressor().compress))
+        except ImportError:
+            pass
+        with TemporaryDirectory() as directory:
+            for extension, compress in compressors:
+                path = Path(directory) / f"data.nt.{extension}"
+                path.write_bytes(compress(serialization))
+                for store in ("default", "oxigraph"):
+                    for workers in (None, 2):
+                        with self.subTest(store=store, compression=extension, workers=workers):
+                            graph = Graph(store=store)
+                            graph.parse(path, format="ox-nt", workers=workers)
+                            self.assertEqual(list(graph), [(s, p, o)])
+
+    def test_parse_in_memory(self) -> None:
+        serialization = "<http://example.com/s> <http://example.com/vocab#p> <http://example.com/o> .\n"
+        for data in (serialization, serialization.encode()):
+            with self.subTest(data=data):
+                with patch.object(OxigraphStore, "_load") as load:
+                    Graph(store="oxigraph").parse(data=data, format="ox-nt")
+                    self.assertIsInstance(load.call_args.kwargs["input"], (str, bytes))
+                with patch("oxrdflib.parser.parse", wraps=pyoxigraph.parse) as parse:
+                    graph = Graph()
+                    graph.parse(data=data, format="ox-nt")
+                    self.assertIsInstance(parse.call_args.kwargs["input"], (str, bytes))
+                    self.assertEqual(list(graph), [(s, p, o)])
+
+    def test_import_without_sparql_engine(self) -> None:
+        # The rdflib SPARQL engine is slow to import and not needed to parse
+        code = (
+            "import sys\n"
+            "from rdflib import Graph\n"
+            "import oxrdflib.parser, oxrdflib.serializer\n"
+            "Graph(store='Oxigraph').parse(data='<http://example.com/s> <http://example.com/p> 1 .', format='ox-ttl')\n"
+            "assert 'rdflib.plugins.sparql' not in sys.modules, 'rdflib SPARQL engine imported'\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+
+    def test_parse_parallel_unsupported_format(self) -> None:
+        with self.assertRaises(ParserError):
+            Graph(store="oxigraph").parse(StringIO("<s> <p> <o> ."), format="ox-turtle", workers=2)
+
 
 if __name__ == "__main__":
     unittest.main()
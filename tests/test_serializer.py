@@ -1,6 +1,9 @@
 import unittest
 
-from rdflib import Dataset, Graph, URIRef
+from rdflib import XSD, BNode, Dataset, Graph, Literal, URIRef, plugin
+from rdflib.serializer import Serializer
+
+from oxrdflib.serializer import OxigraphStreamingJsonLdSerializer
 
 s = URIRef("http://example.com/s")
 p = URIRef("http://example.com/vocab#p")
@@ -44,6 +47,25 @@ class TestSerializer(unittest.TestCase):
                     graph.bind("v", "http://example.com/vocab#")
                     self.assertTrue(graph.serialize(format=fmt).endswith(serialization))
 
+    def test_serialize_terms(self) -> None:
+        graph = Graph()
+        graph.add((BNode("b"), p, Literal("a", lang="en")))
+        graph.add((s, p, Literal("1", datatype=XSD.integer)))
+        graph.add((s, p, Literal("2", datatype=XSD.integer)))
+        graph.add((s, p, Literal("a")))
+        self.assertEqual(
+            sorted(graph.serialize(format="ox-ntriples").splitlines()),
+            [
+                '<http://example.com/s> <http://example.com/vocab#p> "1"^^<http://www.w3.org/2001/XMLSchema#integer> .',
+                '<http://example.com/s> <http://example.com/vocab#p> "2"^^<http://www.w3.org/2001/XMLSchema#integer> .',
+                '<http://example.com/s> <http://example.com/vocab#p> "a" .',
+                '_:b <http://example.com/vocab#p> "a"@en .',
+            ],
+        )
+
+    def test_streaming_json_ld_plugin(self) -> None:
+        self.assertIs(plugin.get("ox-streaming-json-ld", Serializer), OxigraphStreamingJsonLdSerializer)
+
     def test_serialize_dataset(self) -> None:
         for store in ("default", "oxigraph"):
             for fmt, serialization in (
@@ -1,8 +1,17 @@
 import json
+import math
 import unittest
 
 import rdflib
-from rdflib import RDF, ConjunctiveGraph, Dataset, Graph, Namespace
+from rdflib import RDF, XSD, BNode, ConjunctiveGraph, Dataset, Graph, Literal, Namespace
+from rdflib.graph import DATASET_DEFAULT_GRAPH_ID
+from rdflib.plugins.sparql import prepareQuery, prepareUpdate
+from rdflib.plugins.sparql.algebra import translateQuery
+from rdflib.plugins.sparql.parser import parseQuery
+
+from oxrdflib import OxigraphStore
+from oxrdflib._cache import CacheInfo
+from oxrdflib.columns import TermKind
 
 EX = Namespace("http://example.com/")
 
@@ -90,6 +99,122 @@ class SparqlTestCase(unittest.TestCase):
             b"<http://example.com/foo> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://example.com/Entity> .",
         )
 
+    def test_construct_query_store_result(self) -> None:
+        g = ConjunctiveGraph("Oxigraph")
+        g.add((EX.foo, RDF.type, EX.Entity))
+        result = g.query("CONSTRUCT WHERE { ?s ?p ?o }", construct_result="store")
+        self.assertIsInstance(result.graph.store, OxigraphStore)
+        self.assertIsNot(result.graph.store, g.store)
+        self.assertEqual(len(result), 1)
+        self.assertEqual(list(result), [(EX.foo, RDF.type, EX.Entity)])
+
+    def test_construct_query_iterator_result(self) -> None:
+        g = ConjunctiveGraph("Oxigraph")
+        g.add((EX.foo, RDF.type, EX.Entity))
+        result = g.query("DESCRIBE ?s WHERE { ?s ?p ?o }", construct_result="iterator")
+        self.assertEqual(list(result), [(EX.foo, RDF.type, EX.Entity)])
+        self.assertEqual(list(result), [])
+
+    def test_construct_query_invalid_result(self) -> None:
+        g = ConjunctiveGraph("Oxigraph")
+        with self.assertRaises(ValueError):
+            g.query("CONSTRUCT WHERE { ?s ?p ?o }", construct_result="foo")
+
+    def test_select_query_columns(self) -> None:
+        store = OxigraphStore()
+        g = Graph(store, identifier=DATASET_DEFAULT_GRAPH_ID)
+        g.add((EX.foo, EX.value, Literal(12)))
+        g.add((EX.bar, EX.value, Literal("a", lang="en")))
+        g.add((BNode("b"), EX.value, Literal("1.5", datatype=XSD.decimal)))
+        result = store.query_columns(
+            "SELECT ?s ?v ?n WHERE { ?s ex:value ?v } ORDER BY STR(?v)", initNs={"ex": EX}, batch_size=2
+        )
+        self.assertEqual(result.variables, ["s", "v", "n"])
+        self.assertEqual(result.row_count, 3)
+        s, v, n = (result.columns[name] for name in result.variables)
+        self.assertEqual(list(s.kinds), [TermKind.BLANK_NODE, TermKind.NAMED_NODE, TermKind.NAMED_NODE])
+        self.assertEqual(s.values, ["b", str(EX.foo), str(EX.bar)])
+        self.assertEqual(list(v.kinds), [TermKind.LITERAL] * 3)
+        self.assertEqual(v.values, ["1.5", "12", "a"])
+        self.assertEqual(v.datatypes, [str(XSD.decimal), str(XSD.integer), str(RDF.langString)])
+        self.assertEqual(v.languages, [None, None, "en"])
+        self.assertEqual(list(v.numbers[:2]), [1.5, 12.0])
+        self.assertTrue(math.isnan(v.numbers[2]))
+        self.assertEqual(list(n.kinds), [TermKind.UNBOUND] * 3)
+        self.assertEqual(n.values, [None] * 3)
+
+    def test_select_query_columns_not_select(self) -> None:
+        with self.assertRaises(ValueError):
+            OxigraphStore().query_columns("ASK {}")
+
+    def test_query_cache(self) -> None:
+        store = OxigraphStore(query_cache_size=10)
+        g = Graph(store, identifier=DATASET_DEFAULT_GRAPH_ID)
+        g.add((EX.foo, RDF.type, EX.Entity))
+        g.bind("ex", EX)
+        query = "SELECT ?s WHERE { ?s a ex:Entity }"
+        for _ in range(3):
+            self.assertEqual([r.s for r in g.query(query)], [EX.foo])
+        self.assertEqual(store.query_cache_info(), CacheInfo(2, 1, 10, 1))
+        g.update("INSERT DATA { ex:bar a ex:Entity }")
+        self.assertEqual(store.query_cache_info(), CacheInfo(2, 2, 10, 2))
+        # Binding the prefix to an other namespace invalidates the cache
+        g.bind("ex", Namespace("http://example.org/"), replace=True)
+        self.assertEqual(list(g.query(query)), [])
+        self.assertEqual(store.query_cache_info(), CacheInfo(0, 1, 10, 1))
+
+    def test_submit_query(self) -> None:
+        store = OxigraphStore(query_workers=4, term_cache_size=10)
+        g = Graph(store, identifier=DATASET_DEFAULT_GRAPH_ID)
+        for i in range(100):
+            g.add((EX[f"s{i}"], RDF.type, EX.Entity))
+        query = "SELECT ?s WHERE { ?s a ex:Entity }"
+        futures = []
+        for i in range(20):
+            futures.append(store.submit_query(query, initNs={"ex": EX}))
+            g.bind(f"p{i}", EX[f"p{i}/"])  # Concurrent binding changes
+        for future in futures:
+            self.assertEqual(len(future.result()), 100)
+        result = store.submit_query("ASK { ?s a ex:Entity }", initNs={"ex": EX}).result()
+        self.assertTrue(result.askAnswer)
+        with self.assertRaises(ValueError):
+            store.submit_query("CONSTRUCT WHERE { ?s ?p ?o }", construct_result="iterator")
+        store.close()
+        with self.assertRaises(ValueError):
+            OxigraphStore(query_workers=0)
+
+    def test_query_cache_disabled(self) -> None:
+        store = OxigraphStore(query_cache_size=0)
+        g = Graph(store, identifier=DATASET_DEFAULT_GRAPH_ID)
+        g.add((EX.foo, RDF.type, EX.Entity))
+        self.assertEqual([r.s for r in g.query("SELECT ?s WHERE { ?s a ex:Entity }", initNs={"ex": EX})], [EX.foo])
+        self.assertIsNone(store.query_cache_info())
+
+    def test_prepared_query(self) -> None:
+        store = OxigraphStore()
+        g = Graph(store, identifier=DATASET_DEFAULT_GRAPH_ID)
+        g.add((EX.foo, RDF.type, EX.Entity))
+        query = prepareQuery("SELECT ?s WHERE { ?s a ex:Entity }", initNs={"ex": EX})
+        # The store evaluates it itself instead of letting rdflib do it
+        result = store.query(query, {}, {}, DATASET_DEFAULT_GRAPH_ID)
+        self.assertEqual([r.s for r in result], [EX.foo])
+        self.assertEqual([r.s for r in g.query(query, initBindings={"s": EX.foo})], [EX.foo])
+
+    def test_prepared_update(self) -> None:
+        store = OxigraphStore()
+        g = Graph(store, identifier=DATASET_DEFAULT_GRAPH_ID)
+        update = prepareUpdate("INSERT DATA { <foo> a ex:Entity }", initNs={"ex": EX}, base=str(EX))
+        store.update(update, {}, {}, DATASET_DEFAULT_GRAPH_ID)
+        self.assertEqual(list(g), [(EX.foo, RDF.type, EX.Entity)])
+
+    def test_parsed_query_without_text(self) -> None:
+        store = OxigraphStore()
+        query = translateQuery(parseQuery("ASK {}"))
+        with self.assertRaises(NotImplementedError):
+            store.query(query, {}, {}, DATASET_DEFAULT_GRAPH_ID)
+        # rdflib evaluates it instead
+        self.assertTrue(Graph(store).query(query).askAnswer)
+
     def test_select_query_init_bindings(self) -> None:
         g = Graph("Oxigraph")
         result = g.query("SELECT ?s WHERE {}", initBindings={"s": EX.foo})
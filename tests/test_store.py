@@ -1,10 +1,15 @@
+import json
 import unittest
 from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
 
-from pyoxigraph import Store
-from rdflib import RDF, XSD, BNode, ConjunctiveGraph, Graph, Literal, Namespace
+from pyoxigraph import NamedNode, Quad, RdfFormat, Store, Triple
+from rdflib import RDF, XSD, BNode, ConjunctiveGraph, Graph, Literal, Namespace, URIRef
+from rdflib.graph import DATASET_DEFAULT_GRAPH_ID
 
 from oxrdflib import OxigraphStore
+from oxrdflib._cache import CacheInfo
 
 EX = Namespace("http://example.com/")
 
@@ -50,6 +55,372 @@ class StoreTestCase(unittest.TestCase):
         graph2.parse(data=json_ld, format="json-ld")
         self.assertEqual(graph1, graph2)
 
+    def test_term_cache(self) -> None:
+        store = OxigraphStore(term_cache_size=10)
+        g = Graph(store=store, identifier=EX.g)
+        g.add((EX.s, EX.p, EX.o))
+        self.assertEqual(store.term_cache_info(), CacheInfo(hits=0, misses=4, maxsize=10, currsize=4))
+        g.add((EX.s, EX.p, EX.o))
+        self.assertEqual(store.term_cache_info(), CacheInfo(hits=4, misses=4, maxsize=10, currsize=4))
+        # The pattern terms are already cached but not the Oxigraph subject, predicate and object returned by the store
+        self.assertEqual(list(g.triples((EX.s, None, None))), [(EX.s, EX.p, EX.o)])
+        self.assertEqual(store.term_cache_info(), CacheInfo(hits=6, misses=7, maxsize=10, currsize=7))
+        self.assertEqual(list(g.triples((EX.s, None, None))), [(EX.s, EX.p, EX.o)])
+        self.assertEqual(store.term_cache_info(), CacheInfo(hits=11, misses=7, maxsize=10, currsize=7))
+
+    def test_term_cache_eviction(self) -> None:
+        store = OxigraphStore(term_cache_size=2)
+        g = Graph(store=store, identifier=EX.g)
+        self._fill_graph(g)
+        self._test_graph(g)
+        info = store.term_cache_info()
+        if info is None:
+            self.fail("The term cache should be enabled")
+        self.assertEqual(info.maxsize, 2)
+        self.assertLessEqual(info.currsize, 2 * 2)  # One cache per conversion direction
+
+    def test_triples_batches(self) -> None:
+        g = ConjunctiveGraph(OxigraphStore(read_batch_size=3))
+        for i in range(50):
+            g.get_context(EX[f"g{i % 2}"]).add((EX[f"s{i % 7}"], EX.p, Literal(i)))
+        triples = list(g.triples((None, EX.p, None)))
+        self.assertEqual(len(triples), 50)
+        self.assertEqual({t[2] for t in triples}, {Literal(i) for i in range(50)})
+        self.assertEqual(
+            {(s, o, c.identifier) for s, _, o, c in g.quads((None, EX.p, None))},
+            {(EX[f"s{i % 7}"], Literal(i), EX[f"g{i % 2}"]) for i in range(50)},
+        )
+
+    def test_triples_quoted_triple(self) -> None:
+        for term_cache_size in (None, 10):
+            store = Store()
+            quoted = Triple(NamedNode(EX.s), NamedNode(EX.p), NamedNode(EX.o))
+            store.add(Quad(NamedNode(EX.a), NamedNode(EX.says), quoted))
+            g = Graph(
+                store=OxigraphStore(store=store, term_cache_size=term_cache_size),
+                identifier=DATASET_DEFAULT_GRAPH_ID,
+            )
+            self.assertEqual(list(g.triples((None, None, None))), [(EX.a, EX.says, (EX.s, EX.p, EX.o))])
+
+    def test_add_n_batches(self) -> None:
+        g = Graph(store=OxigraphStore(write_batch_size=3), identifier=EX.g)
+        g.addN((EX.s, EX.p, Literal(i), g) for i in range(10))
+        self.assertEqual(len(g), 10)
+        self.assertEqual(set(g.objects(EX.s, EX.p)), {Literal(i) for i in range(10)})
+
+    def test_invalid_write_batch_size(self) -> None:
+        with self.assertRaises(ValueError):
+            OxigraphStore(write_batch_size=0)
+
+    def test_len(self) -> None:
+        g = ConjunctiveGraph("Oxigraph")
+        g1 = g.get_context(EX.g1)
+        g2 = g.get_context(EX.g2)
+        self.assertEqual((len(g), len(g1), len(g2)), (0, 0, 0))
+        g1.add((EX.s, EX.p, EX.o1))
+        g1.add((EX.s, EX.p, EX.o1))
+        g2.addN([(EX.s, EX.p, EX.o1, g2), (EX.s, EX.p, EX.o2, g2), (EX.s, EX.p, EX.o2, g2)])
+        self.assertEqual((len(g), len(g1), len(g2)), (2, 1, 2))
+        g2.remove((None, None, EX.o1))
+        self.assertEqual((len(g), len(g1), len(g2)), (2, 1, 1))
+        g1.remove((None, None, None))
+        self.assertEqual((len(g), len(g1), len(g2)), (1, 0, 1))
+        g.update("INSERT DATA { GRAPH <http://example.com/g1> { <http://example.com/s> <http://example.com/p> 1 } }")
+        self.assertEqual((len(g), len(g1), len(g2)), (2, 1, 1))
+        g.store.remove_graph(g2)
+        self.assertEqual((len(g), len(g1), len(g2)), (1, 1, 0))
+
+    def test_len_persisted(self) -> None:
+        g = ConjunctiveGraph("Oxigraph")
+        g.open("test_store")
+        self._fill_graph(g)
+        self.assertEqual(len(g), 4)
+        g.close()
+
+        g = ConjunctiveGraph("Oxigraph")
+        g.open("test_store")
+        with patch.object(OxigraphStore, "_count_triples") as count_triples:
+            self.assertEqual(len(g), 4)
+            count_triples.assert_not_called()
+        g.add((EX.foo, EX.prop, EX.bar))
+        self.assertEqual(len(g), 5)
+        g.close()
+        g.destroy("test_store")
+
+    def test_open_options(self) -> None:
+        with TemporaryDirectory() as directory:
+            path = str(Path(directory) / "store")
+            g = ConjunctiveGraph("Oxigraph")
+            g.open(f"{path}?mode=bulk&term_cache_size=100&read_batch_size=2", create=True)
+            self.assertTrue(g.store._bulk_writes)
+            self.assertEqual(g.store._read_batch_size, 2)
+            self.assertEqual(g.store.term_cache_info().maxsize, 100)
+            self._fill_graph(g)
+            g.close()
+
+            # Persists the triple counts
+            g = ConjunctiveGraph("Oxigraph")
+            g.open(path)
+            self.assertEqual(len(g), 4)
+            g.close()
+
+            g = ConjunctiveGraph("Oxigraph")
+            g.open({"path": path, "mode": "read_only", "autocommit": False})
+            self.assertFalse(g.store._autocommit)
+            self._test_graph(g)
+            self.assertEqual(len(g), 4)
+            with self.assertRaises(RuntimeError):
+                g.store._inner.add(Quad(NamedNode(EX.s), NamedNode(EX.p), NamedNode(EX.o)))
+            g.close()
+            # A read-only store does not remove the persisted counts
+            self.assertIn("triple_counts", json.loads((Path(path) / "oxrdflib.json").read_text()))
+
+            g.destroy(f"{path}?mode=bulk")
+            self.assertFalse(Path(path).exists())
+
+    def test_len_failed_write(self) -> None:
+        with TemporaryDirectory() as directory:
+            path = str(Path(directory) / "store")
+            g = ConjunctiveGraph("Oxigraph")
+            g.open(path, create=True)
+            g.get_context(EX.g).add((EX.s, EX.p, EX.o))
+            g.close()
+
+            g = ConjunctiveGraph("Oxigraph")
+            g.open(f"{path}?mode=read_only")
+            context = g.get_context(EX.g)
+            self.assertEqual((len(g), len(context)), (1, 1))
+            with self.assertRaises(RuntimeError):
+                context.add((EX.s, EX.p, EX.o2))
+            with self.assertRaises(RuntimeError):
+                context.remove((None, None, None))
+            with self.assertRaises(RuntimeError):
+                g.store.bulk_remove((EX.s, None, None), context)
+            self.assertEqual((len(g), len(context)), (1, 1))
+            g.close()
+
+    def test_namespaces_persisted(self) -> None:
+        with TemporaryDirectory() as directory:
+            path = str(Path(directory) / "store")
+            g = Graph("Oxigraph", identifier=EX.g, bind_namespaces="none")
+            g.open(path, create=True)
+            g.bind("ex", EX)
+            g.bind("ex2", EX)
+            g.bind("foo", "http://example.com/foo#")
+            g.add((EX.s, EX.p, EX.o))
+            g.close()
+
+            g = Graph("Oxigraph", identifier=EX.g)
+            g.open(path)
+            self.assertEqual(g.store.namespace("ex2"), URIRef(EX))
+            self.assertIsNone(g.store.namespace("ex"))
+            self.assertEqual(g.store.prefix(URIRef("http://example.com/foo#")), "foo")
+            self.assertIn("@prefix ex2: <http://example.com/> .", g.serialize(format="ox-turtle"))
+            g.close()
+
+    def test_namespaces_saved_by_batches(self) -> None:
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / "store"
+            store = OxigraphStore()
+            store.open(str(path), create=True)
+            with patch("oxrdflib.store._BINDINGS_SAVE_BATCH_SIZE", 2):
+                store.bind("a", URIRef("http://example.com/a#"))
+                self.assertFalse((path / "oxrdflib.json").exists())
+                store.bind("b", URIRef("http://example.com/b#"))
+            self.assertEqual(
+                json.loads((path / "oxrdflib.json").read_text())["namespaces"],
+                [["a", "http://example.com/a#"], ["b", "http://example.com/b#"]],
+            )
+            store.close()
+
+    def test_open_invalid_options(self) -> None:
+        with TemporaryDirectory() as directory:
+            path = str(Path(directory) / "store")
+            for configuration in (
+                f"{path}?mode=unknown",
+                f"{path}?foo=1",
+                f"{path}?read_batch_size=foo",
+                f"{path}?read_batch_size=0",
+                f"{path}?autocommit=maybe",
+                f"{path}?mode",
+                {"mode": "bulk"},
+            ):
+                with self.subTest(configuration=configuration), self.assertRaises(ValueError):
+                    OxigraphStore().open(configuration, create=True)
+            with self.assertRaises(ValueError):
+                OxigraphStore().open(f"{path}?mode=read_only", create=True)
+
+    def test_bulk_remove(self) -> None:
+        store = OxigraphStore()
+        g = ConjunctiveGraph(store)
+        g1 = g.get_context(EX.g1)
+        g2 = g.get_context(EX.g2)
+        for c in (g1, g2):
+            c.add((EX.s, EX.p, Literal("a b")))
+            c.add((EX.s, EX.p, BNode("b")))
+            c.add((BNode("b"), EX.p, EX.o))
+            c.add((EX.s, EX.p2, EX.o))
+        self.assertEqual(store.bulk_remove((None, EX.p, Literal("a b")), g1), 1)
+        self.assertEqual(store.bulk_remove((BNode("b"), None, None), None), 2)
+        self.assertEqual(store.bulk_remove((None, EX.p, None), None), 3)
+        self.assertEqual(store.bulk_remove((None, EX.p, None), None), 0)
+        self.assertEqual(len(g), 1)
+        self.assertEqual(store.bulk_remove((None, None, None), g2), 1)
+        self.assertEqual(len(g1), 1)
+        self.assertEqual(len(g2), 0)
+        self.assertEqual(len(g), 1)
+
+    def test_export_graphs(self) -> None:
+        store = OxigraphStore()
+        g = ConjunctiveGraph(store)
+        g.get_context(DATASET_DEFAULT_GRAPH_ID).add((EX.s, EX.p, EX.o))
+        g.get_context(EX.g1).add((EX.s, EX.p, Literal("a")))
+        g.get_context(EX.g2).add((EX.s, EX.p, Literal("b")))
+        with TemporaryDirectory() as directory:
+            manifest_path = store.export_graphs(Path(directory) / "export", RdfFormat.TURTLE, workers=2)
+            with manifest_path.open(encoding="utf-8") as fp:
+                manifest = json.load(fp)
+            self.assertEqual(manifest["format"], "text/turtle")
+            files = {graph["graph"]: manifest_path.parent / graph["file"] for graph in manifest["graphs"]}
+            self.assertEqual(set(files), {"DEFAULT", f"<{EX.g1}>", f"<{EX.g2}>"})
+            for graph_name, context in (("DEFAULT", DATASET_DEFAULT_GRAPH_ID), (f"<{EX.g1}>", EX.g1)):
+                exported = Graph(store="Oxigraph").parse(files[graph_name], format="ox-turtle")
+                self.assertEqual(set(exported), set(g.get_context(context)))
+        with self.assertRaises(ValueError):
+            store.export_graphs("export", workers=0)
+
+    def test_import_files(self) -> None:
+        for autocommit in (True, False):
+            with self.subTest(autocommit=autocommit), TemporaryDirectory() as directory:
+                good = Path(directory) / "good.nt"
+                good.write_text(f"<{EX.s}> <{EX.p}> <{EX.o}> .\n_:b <{EX.p}> <{EX.o}> .\n")
+                bad = Path(directory) / "bad.ttl"
+                bad.write_text(f"<{EX.s}> <{EX.p}> .\n")
+                store = OxigraphStore(autocommit=autocommit)
+                g = ConjunctiveGraph(store)
+                errors = store.import_files(
+                    [
+                        (good, RdfFormat.N_TRIPLES, EX.g1),
+                        (str(good), RdfFormat.N_TRIPLES, None),
+                        (bad, RdfFormat.TURTLE, EX.g2),
+                        (Path(directory) / "missing.nt", RdfFormat.N_TRIPLES, EX.g2),
+                    ],
+                    workers=2,
+                )
+                self.assertEqual(set(errors), {bad, Path(directory) / "missing.nt"})
+                self.assertIsInstance(errors[bad], SyntaxError)
+                store.commit()
+                self.assertEqual(len(g.get_context(EX.g1)), 2)
+                self.assertEqual(len(g.get_context(DATASET_DEFAULT_GRAPH_ID)), 2)
+                self.assertEqual(len(g.get_context(EX.g2)), 0)
+                # Each file has its own blank nodes
+                self.assertEqual(len(set(g.subjects())), 3)
+
+    def test_transaction(self) -> None:
+        a = Literal("a", datatype=XSD.string)
+        store = OxigraphStore(autocommit=False)
+        g = ConjunctiveGraph(store)
+        g1 = g.get_context(EX.g1)
+        g1.add((EX.s, EX.p, EX.o1))
+        g.commit()
+        g1.add((EX.s, EX.p, EX.o2))
+        g1.remove((EX.s, EX.p, EX.o1))
+        g.get_context(EX.g2).add((EX.s, EX.p, a))
+        self.assertEqual(set(g1.objects(EX.s, EX.p)), {EX.o2})
+        self.assertEqual(len(g1), 1)
+        self.assertEqual(len(g), 2)
+        self.assertEqual({c.identifier for c in g.contexts()}, {EX.g1, EX.g2})
+        # rdflib SPARQL engine is used instead of Oxigraph one because it sees the pending changes
+        self.assertEqual({r.o for r in g.query("SELECT ?o WHERE { ?s ?p ?o }")}, {EX.o2, a})
+        self.assertEqual(len(store._inner), 1)
+        g.commit()
+        self.assertEqual(len(store._inner), 2)
+        self.assertEqual({r.o for r in g.query("SELECT ?o WHERE { ?s ?p ?o }")}, {EX.o2, a})
+
+        g1.add((EX.s, EX.p, EX.o3))
+        store.remove_graph(g.get_context(EX.g2))
+        self.assertEqual(len(g), 2)
+        g.rollback()
+        self.assertEqual(set(g.objects(EX.s, EX.p)), {EX.o2, a})
+        self.assertEqual(len(g), 2)
+
+    def test_transaction_len(self) -> None:
+        store = OxigraphStore(autocommit=False)
+        g = ConjunctiveGraph(store)
+        g1 = g.get_context(EX.g1)
+        g2 = g.get_context(EX.g2)
+        g1.add((EX.s, EX.p, EX.o1))
+        g1.add((EX.s, EX.p, EX.o2))
+        g2.add((EX.s, EX.p, EX.o1))
+        g.commit()
+        self.assertEqual((len(g), len(g1), len(g2)), (2, 2, 1))
+        g2.add((EX.s, EX.p, EX.o1))  # already there
+        g2.add((EX.s, EX.p, EX.o2))  # new in g2 but not in the union
+        g2.add((EX.s, EX.p, EX.o3))  # new
+        g1.remove((EX.s, EX.p, EX.o1))  # still in g2
+        g1.remove((EX.s, EX.p, EX.o3))  # not there
+        with patch.object(store, "_count_triples") as count_triples:
+            self.assertEqual((len(g), len(g1), len(g2)), (3, 1, 3))
+            count_triples.assert_not_called()
+        g2.remove((None, None, None))
+        self.assertEqual((len(g), len(g1), len(g2)), (1, 1, 0))
+        g.commit()
+        self.assertEqual((len(g), len(g1), len(g2)), (1, 1, 0))
+
+    def test_transaction_blank_nodes(self) -> None:
+        store = OxigraphStore(autocommit=False)
+        g = ConjunctiveGraph(store)
+        g.add((BNode("b"), EX.p, EX.o1, g.default_context))
+        g.commit()
+        g.remove((BNode("b"), EX.p, EX.o1))
+        g.add((BNode("b"), EX.p, EX.o2, g.default_context))
+        g.commit()
+        self.assertEqual(list(g.triples((None, None, None))), [(BNode("b"), EX.p, EX.o2)])
+
+    def test_transaction_close(self) -> None:
+        g = ConjunctiveGraph(OxigraphStore(autocommit=False))
+        g.open("test_store")
+        g.add((EX.s, EX.p, EX.o1))
+        g.close(commit_pending_transaction=True)
+        g = ConjunctiveGraph(OxigraphStore(autocommit=False))
+        g.open("test_store")
+        g.add((EX.s, EX.p, EX.o2))
+        g.close()
+        g = ConjunctiveGraph("Oxigraph")
+        g.open("test_store")
+        self.assertEqual(set(g.objects(EX.s, EX.p)), {EX.o1})
+        g.close()
+        g.destroy("test_store")
+
+    def test_len_persisted_external_write(self) -> None:
+        g = ConjunctiveGraph("Oxigraph")
+        g.open("test_store")
+        g.add((EX.foo, RDF.type, EX.Entity))
+        self.assertEqual(len(g), 1)
+        g.close()
+
+        store = Store("test_store")
+        store.add(Quad(NamedNode(EX.foo), NamedNode(EX.prop), NamedNode(EX.bar)))
+        del store
+
+        g = ConjunctiveGraph("Oxigraph")
+        g.open("test_store")
+        self.assertEqual(len(g), 2)
+        g.close()
+        g.destroy("test_store")
+
+    def test_len_single_named_graph(self) -> None:
+        g = ConjunctiveGraph("Oxigraph")
+        g1 = g.get_context(EX.g1)
+        g1.add((EX.s, EX.p, EX.o1))
+        g1.add((EX.s, EX.p, EX.o2))
+        self.assertEqual((len(g), len(g1)), (2, 2))
+        g.get_context(EX.g2).add((EX.s, EX.p, EX.o1))
+        self.assertEqual(len(g), 2)
+
+    def test_term_cache_disabled(self) -> None:
+        self.assertIsNone(OxigraphStore().term_cache_info())
+
     @staticmethod
     def _fill_graph(g: Graph) -> None:
         g.add((EX.foo, RDF.type, EX.Entity))